@@ -0,0 +1,43 @@
+"""
+adjumerate vs enumerate over the same data.
+
+run with `python benchmarks/bench_adjumerate.py` from the repository root.
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from easytools.adjumerate import adjumerate
+
+
+def bench(loop, number=10, repeat=5):
+    return min(timeit.repeat(loop, number=number, repeat=repeat)) / number
+
+
+def main(n=100000):
+    data = list(range(n))
+
+    def with_enumerate():
+        for i, x in enumerate(data):
+            pass
+
+    def with_adjumerate():
+        for i, x in adjumerate(data):
+            pass
+
+    def with_adjumerate_adjusted():
+        for i, x in adjumerate(data):
+            if i == 10:
+                i -= 1
+
+    loops = (('enumerate', with_enumerate), ('adjumerate', with_adjumerate), ('adjumerate, compared', with_adjumerate_adjusted))
+    times = {name: bench(loop) for name, loop in loops}
+
+    print(f"{'loop':<24}{'per item (ns)':>16}{'vs enumerate':>16}")
+    for name, t in times.items():
+        print(f"{name:<24}{t / n * 1e9:>16.1f}{t / times['enumerate']:>15.1f}x")
+
+if __name__ == "__main__":
+    main()
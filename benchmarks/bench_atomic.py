@@ -0,0 +1,47 @@
+"""
+MutableInteger vs AtomicInteger vs ShardedCounter incremented from several threads at once.
+
+shows time per increment and how many increments were lost. run with `python benchmarks/bench_atomic.py`
+from the repository root.
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from easytools.mutables import MutableInteger, AtomicInteger, ShardedCounter
+
+
+def hammer(counter, n_threads, n):
+    def work():
+        c = counter
+        for _ in range(n):
+            c += 1
+
+    threads = [threading.Thread(target=work) for _ in range(n_threads)]
+    began = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - began
+
+
+def main(n=200000):
+    # switch threads often, so races show up under the GIL as well
+    sys.setswitchinterval(1e-5)
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+
+    print(f"{'counter':<16}{'threads':>8}{'per increment (ns)':>20}{'lost':>12}")
+    for n_threads in (1, 2, 4, 8):
+        for cls in (MutableInteger, AtomicInteger, ShardedCounter):
+            counter = cls()
+            t = hammer(counter, n_threads, n)
+            total = n_threads * n
+            print(f"{cls.__name__:<16}{n_threads:>8}{t / total * 1e9:>20.1f}{total - int(counter):>12}")
+
+if __name__ == "__main__":
+    main()
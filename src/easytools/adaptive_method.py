@@ -1,7 +1,12 @@
 import inspect
 from functools import wraps
-from easytools.adjumerate import adjumerate
-from easytools.unique_token import UniqueTokenHandler
+from operator import attrgetter
+from easytools.arg_binding import SignatureLayout
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def is_instance_of_method(obj, method):
@@ -13,43 +18,11 @@ def arg_formatter(parameters_dict, f_args, f_kwargs, preseded_args_dict=None, re
     f_args = arguments passed to function in call
     f_kwargs = keyword arguments passed to function in call
     preseded_args_dict = dict containing parameters to use values from this dict for ({parameter:argument}). these are superseded by f_args and f_kwargs.
-    """
-
-    u = UniqueTokenHandler()
-    t = u.generate()
-
-    parameters = list(parameters_dict.keys())[remove_first:]
-    new_args = [t] * len(parameters)
-    new_kwargs = f_kwargs.copy()
-
-    #set defaults
-    for i, p in enumerate(parameters):
-        if parameters_dict[p].default != inspect.Parameter.empty:
-            new_args[i] = parameters_dict[p].default
-
-    #insert lesser priority args
-    if preseded_args_dict:
-        for i, p in enumerate(parameters):
-            if p in preseded_args_dict.keys():
-                new_args[i] = preseded_args_dict[p]
-
-    #replace with args
-    for i, p in adjumerate(parameters):
-        if p in new_kwargs:
-            new_args[i.raw] = new_kwargs[p]
-            del new_kwargs[p]
-            i -= 1
-        else:
-            try:
-                new_args[i.raw] = f_args[i]
-            except IndexError as e:
-                pass
 
-    #ensure all positions are filled
-    if t in new_args:
-        return None, new_args.index(t)
-
-    return new_args, new_kwargs
+    returns (new_args, new_kwargs), or (None, index of first unfilled parameter).
+    builds a SignatureLayout on every call; keep a layout around instead when binding repeatedly.
+    """
+    return SignatureLayout(parameters_dict, remove_first=remove_first).bind(f_args, f_kwargs, preseded_args_dict)
 
 
 
@@ -63,56 +36,139 @@ def untyped(param_to_instance_attr_map=None, inverse=False):
         def __init__(self, func):
             self.func = func
             self.sig = inspect.signature(func)
+            self.parameters = list(self.sig.parameters.keys())[1:]  # Skip 'self'
+            self.layout = SignatureLayout(self.sig, remove_first=True)
+
+            # parameter -> instance attribute plan, validated once here instead of on every call
+            self.plan = self.make_plan()
+            # type(instance) -> (params, batched getter, entries missing on the first instance seen)
+            self.type_plans = {}
+
+        def make_plan(self):
+            #no instancevardict provided; assume standard naming of parameter = class var name
+            if not param_to_instance_attr_map:
+                return [(p, p) for p in self.parameters]
+
+            #list provided; assume standard naming of parameter = class var name
+            if isinstance(param_to_instance_attr_map, list):
+                if inverse:
+                    return [(p, p) for p in self.parameters if p not in param_to_instance_attr_map]
+                for p in param_to_instance_attr_map:
+                    if p not in self.parameters:
+                        raise AttributeError(f"{self.func.__name__}() has no parameter '{p}'")
+                return [(p, p) for p in param_to_instance_attr_map]
+
+            #map provided
+            if isinstance(param_to_instance_attr_map, dict):
+                for p in param_to_instance_attr_map.keys():
+                    if p not in self.parameters:
+                        raise AttributeError(f"{self.func.__name__}() has no parameter '{p}'")
+                return list(param_to_instance_attr_map.items())
+
+            return []
+
+        def make_type_plan(self, instance):
+            # attributes present on the first instance of a type are fetched in one batched call;
+            # the rest are looked up individually, so instances that differ from the first still work
+            present = [(p, a) for p, a in self.plan if hasattr(instance, a)]
+            missing = [(p, a) for p, a in self.plan if not hasattr(instance, a)]
+
+            if len(present) == 1:
+                getter = attrgetter(present[0][1])
+                batched = lambda instance: (getter(instance),)
+            elif present:
+                batched = attrgetter(*[a for p, a in present])
+            else:
+                batched = lambda instance: ()
+
+            type_plan = self.type_plans[type(instance)] = ([p for p, a in present], batched, missing)
+            return type_plan
+
+        def fetch(self, instance, entries, kwargs, i_param_dict):
+            for p, a in entries:
+                try:
+                    i_param_dict[p] = getattr(instance, a)
+                except AttributeError:
+                    #map provided; mapped attributes must exist
+                    if isinstance(param_to_instance_attr_map, dict):
+                        raise
+                    # parameter not filled by any of instance var, parameter default, or argument
+                    if inverse and p not in kwargs.keys() and self.sig.parameters[p].default == inspect.Parameter.empty:
+                        raise TypeError(f"{self.func.__name__}() missing at least 1 required positional argument: '{p}'")
+                    #otherwise might occur when running class method in class init, eg self.var = self.untypedfunct(var)
+            return i_param_dict
+
+        def instance_args(self, instance, kwargs):
+            # build instance args dict
+            try:
+                params, batched, missing = self.type_plans[type(instance)]
+            except KeyError:
+                params, batched, missing = self.make_type_plan(instance)
+
+            try:
+                i_param_dict = dict(zip(params, batched(instance)))
+            except AttributeError:
+                return self.fetch(instance, self.plan, kwargs, {})
+
+            if missing:
+                self.fetch(instance, missing, kwargs, i_param_dict)
+            return i_param_dict
+
+        def gather_columns(self, instances, kwargs):
+            # {param: numpy column} of instance attributes, or None if they can't be stacked into numeric columns
+            types = {type(instance) for instance in instances}
+            params, batched, missing = self.type_plans.get(types.pop()) or self.make_type_plan(instances[0])
+            if types or missing:
+                return None
+
+            try:
+                rows = list(map(batched, instances))
+            except AttributeError:
+                return None
+
+            columns = {p: np.asarray(column) for p, column in zip(params, zip(*rows))}
+            # only numbers vectorize; strings and objects would reach the function as arrays they don't act like
+            if any(column.dtype.kind not in 'biufc' for column in columns.values()):
+                return None
+            return columns
+
+        def over(self, instances, *args, vectorize=True, **kwargs):
+            """
+            call the function for every instance in instances, like [instance.foo(*args, **kwargs) for instance in instances].
+                with numpy available, each mapped attribute is gathered across all instances into one array and the
+                function is called once on the columns (self is None), returning an array with one result per instance.
+                if the attributes can't be stacked, or the function can't take arrays (raises TypeError or ValueError,
+                eg `if x > 0` on an array) or doesn't return one result per instance, falls back to per-instance calls
+                and returns a list; the function then runs again per instance, so pass vectorize=False for functions
+                with side effects. any other error is raised as is.
+            """
+            instances = list(instances)
+
+            if vectorize and np is not None and instances:
+                columns = self.gather_columns(instances, kwargs)
+                if columns is not None:
+                    new_args, new_kwargs = self.layout.bind(args, kwargs, preseeded=columns)
+                    if new_args is not None:
+                        try:
+                            result = self.func(None, *new_args, **new_kwargs)
+                        except (TypeError, ValueError):
+                            # the function doesn't work on arrays
+                            result = None
+                        if isinstance(result, np.ndarray) and result.ndim and len(result) == len(instances):
+                            return result
+
+            return [self.__get__(instance, type(instance))(*args, **kwargs) for instance in instances]
 
         def __get__(self, instance, owner):
             @wraps(self.func)
             def bound_method(*args, **kwargs):
                 # If called as an instance method
                 if instance is not None:
-                    parameters = list(self.sig.parameters.keys())[1:]  # Skip 'self'
-
-                    # build instance args list
-                    i_param_dict = {}
-
-                    #no instancevardict provided; assume standard naming of parameter = class var name
-                    if not param_to_instance_attr_map:
-                        for p in parameters:
-                            if p in dir(instance):
-                                i_param_dict[p] = instance.__getattribute__(p)
-
-                    #list provided; assume standard naming of parameter = class var name
-                    if isinstance(param_to_instance_attr_map, list):
-                        if not inverse:
-                            for p in param_to_instance_attr_map:
-                                if p in parameters:
-                                    try:
-                                        i_param_dict[p] = instance.__getattribute__(p)
-                                    except AttributeError as ae:
-                                        pass #this might occur when running class method in class init, eg self.var = self.untypedfunct(var)
-                                else:
-                                    raise AttributeError(f"{self.func.__name__}() has no parameter '{p}'")
-                        else:
-                            for p in parameters:
-                                if p not in param_to_instance_attr_map:
-                                    try:
-                                        i_param_dict[p] = instance.__getattribute__(p)
-                                    # parameter not filled by any of instance var, parameter default, or argument
-                                    except AttributeError as ae:
-                                        if p not in kwargs.keys() and self.sig.parameters[p].default == inspect.Parameter.empty:
-                                            raise TypeError(f"{self.func.__name__}() missing at least 1 required positional argument: '{p}'")
-
-
-                    #map provided
-                    if isinstance(param_to_instance_attr_map, dict):
-                        for p in param_to_instance_attr_map.keys():
-                            if p not in parameters:
-                                raise AttributeError(f"{self.func.__name__}() has no parameter '{p}'")
-                            i_param_dict[p] = instance.__getattribute__(param_to_instance_attr_map[p])
-
+                    i_param_dict = self.instance_args(instance, kwargs)
 
-                    o = arg_formatter(self.sig.parameters, args, kwargs, preseded_args_dict=i_param_dict, remove_first=True)
-                    if o[0] == None:
-                        raise TypeError(f"{self.func.__name__}() missing at least 1 required positional argument: '{parameters[o[1]]}'")
+                    o = self.layout.bind(args, kwargs, preseeded=i_param_dict)
+                    if o[0] is None:
+                        raise TypeError(f"{self.func.__name__}() missing at least 1 required positional argument: '{self.layout.names[o[1]]}'")
 
                     new_args, new_kwargs = o
 
@@ -122,6 +178,7 @@ def untyped(param_to_instance_attr_map=None, inverse=False):
                 else:
                     return self.func(None, *args, **kwargs)
 
+            bound_method.over = self.over
             return bound_method
 
     return AdaptiveMethod
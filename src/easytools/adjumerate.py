@@ -1,16 +1,196 @@
 from easytools.mutables import MutableInteger
-import inspect
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+import json
+import mmap
+import os
+import queue
+import threading
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class adjumerate:
-    def __init__(self, iterable, start=0):
+    """
+    iterable = iterable to enumerate
+    start = first count
+    seekable = if True, the count decides which item comes next: setting the counter to n makes the next
+        item the one at position n + 1 - start. sequences (collections.abc.Sequence, eg lists, and indexable
+        buffers like memoryviews or numpy arrays) are indexed directly; other iterables skip forward in bulk
+        and can rewind into a buffer.
+    buffer = seekable iterators only; number of recent items kept for rewinding
+    chunk = if set, yield (index range, chunk) pairs of up to this many items instead of single items.
+        the counter returned by iter() can repeat(), skip(n) or resize(size) chunks.
+    reuse_buffer = chunk mode over iterators only; fill the same list for every chunk instead of a new one
+    prefetch = iterators only; if set, a background thread reads up to this many items ahead of the loop,
+        so a slow source (file readers, decompressors) works while the loop body runs. errors raised by the
+        source are raised in the loop.
+    block = ndarrays and other buffer objects only; if set, yield (index array, view) pairs of up to this many
+        rows. views are zero-copy slices along the first axis, and the count is the block number: setting it
+        moves the window like seekable=True does for items.
+    checkpoint = if set, the count is saved to this json file every `checkpoint_every` items and/or every
+        `checkpoint_interval` seconds, and when the loop finishes. only items the loop has finished with
+        (ie asked for the next item after) are counted as done.
+    resume_from = checkpoint file to continue from; items already done are skipped (sequences and seekable
+        iterators seek, other iterators are skipped in bulk) and the count carries on where it was. a missing
+        file starts from the beginning, so restarted jobs can always pass the same path.
+    stats = if True (or a number n), track throughput and timing, reading the clock for every 16th (or nth) item
+        only. the counter returned by iter() then has a stats() method with items done, elapsed time, rate,
+        eta (when the iterable has a len()) and latency percentiles. for chunk and block modes these are per
+        chunk/block.
+    stats_callback = called with stats() at most every `stats_interval` seconds while iterating
+    """
+    def __init__(self, iterable, start=0, seekable=False, buffer=0, chunk=None, reuse_buffer=False, block=None,
+                 prefetch=None, checkpoint=None, checkpoint_every=1000, checkpoint_interval=None, resume_from=None,
+                 stats=False, stats_callback=None, stats_interval=1.0):
         self._iterable = iterable
+        self._checkpoint = (checkpoint, checkpoint_every, checkpoint_interval, resume_from)
+        self._stats = (stats, stats_callback, stats_interval)
+        self._prefetch = prefetch
         self._start = start
+        self._seekable = seekable
+        self._buffer = buffer
+        self._chunk = chunk
+        self._reuse_buffer = reuse_buffer
+        self._block = block
+
+        if chunk is not None and seekable:
+            raise ValueError("adjumerate chunk mode is adjusted with repeat()/skip()/resize(), not seekable=True")
+        if block is not None and chunk is not None:
+            raise ValueError("adjumerate takes either chunk or block, not both")
+        if (checkpoint or resume_from) and (chunk is not None or block is not None):
+            raise ValueError("adjumerate checkpoints are per item; they can't be used with chunk or block")
 
     def __iter__(self):
-        return Counter(self._iterable, init_value=self._start)
+        options = {'checkpoint_options': self._checkpoint, 'stats_options': self._stats + (self.total(),)}
+
+        if self._block is not None:
+            return make_counter(BlockCounter, self._iterable, self._block, init_value=self._start, **options)
+
+        iterable = self._iterable
+        if self._prefetch and not is_indexable(iterable):
+            # counters only ever see the prefetcher, so counting works the same as without it
+            iterable = Prefetcher(iterable, self._prefetch)
+
+        if self._chunk is not None:
+            return make_counter(ChunkCounter, iterable, self._chunk, init_value=self._start,
+                                reuse_buffer=self._reuse_buffer, **options)
+        if self._seekable:
+            if is_indexable(iterable):
+                return make_counter(SequenceCounter, iterable, init_value=self._start, **options)
+            return make_counter(IteratorSeekCounter, iterable, init_value=self._start, buffer=self._buffer,
+                                **options)
+        return make_counter(Counter, iterable, init_value=self._start, **options)
+
+    def total(self):
+        # number of steps the counter will take, if the iterable knows its length
+        try:
+            length = len(self._iterable)
+        except TypeError:
+            return None
+        size = self._block or self._chunk
+        return -(-length // size) if size else length
+
+    def __aiter__(self):
+        if self._seekable or self._chunk is not None or self._block is not None:
+            raise ValueError("async adjumerate only supports plain counting")
+        if self._checkpoint[0] or self._checkpoint[3]:
+            raise ValueError("async adjumerate doesn't support checkpoint or resume_from")
+        if self._prefetch:
+            raise ValueError("async adjumerate doesn't support prefetch")
+        if self._stats[0]:
+            raise ValueError("async adjumerate doesn't support stats")
+        return AsyncCounter(self._iterable, init_value=self._start)
+
+    @staticmethod
+    def lines(path, start=0, index_path=None, checkpoint=None, checkpoint_every=1000, checkpoint_interval=None,
+              resume_from=None, stats=False, stats_callback=None, stats_interval=1.0):
+        """
+        seekable adjumerate over the lines of a file, yielding (count, line bytes) pairs.
+        the file is memory-mapped and a line offset index is built once, so setting the counter jumps
+            straight to any line without re-reading the file.
+        index_path = if given, the index is loaded from here when it matches the file, and saved here otherwise
+        checkpoint, checkpoint_every, checkpoint_interval, resume_from, stats, stats_callback, stats_interval =
+            as for adjumerate
+        close the counter (or use it as a context manager) to unmap the file:
+            ```
+            with adjumerate.lines('big.log') as lines:
+                for i, line in lines:
+                    ...
+            ```
+        """
+        line_file = LineFile(path, index_path=index_path)
+        return make_counter(LineCounter, line_file, init_value=start,
+                            checkpoint_options=(checkpoint, checkpoint_every, checkpoint_interval, resume_from),
+                            stats_options=(stats, stats_callback, stats_interval, len(line_file)))
+
+    @staticmethod
+    def parallel(func, iterable, executor=None, window=None, ordered=True, start=0):
+        """
+        run func(item) for every item on a thread or process pool, yielding (count, result) pairs.
+        each count is a snapshot of the counter when its item was submitted, so `raw` and the count work as
+            in a serial loop; adjusting a yielded count changes only that snapshot.
+        executor = a concurrent.futures executor; a thread pool is made (and shut down) if None
+        window = max items in flight at once, bounding memory for long iterables; defaults to 2x the workers
+        ordered = yield in input order if True, otherwise as results complete
+        """
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor()
+        if window is None:
+            window = 2 * (getattr(executor, '_max_workers', None) or os.cpu_count() or 1)
+
+        counts = {}
+        pending = deque()
+
+        def finished():
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+            return counts.pop(future), future.result()
+
+        try:
+            for count, item in Counter(iterable, init_value=start):
+                future = executor.submit(func, item)
+                counts[future] = count.snapshot()
+                pending.append(future)
+                if len(pending) >= window:
+                    yield finished()
+            while pending:
+                yield finished()
+        finally:
+            for future in pending:
+                future.cancel()
+            if own_executor:
+                executor.shutdown()
+
+
+def is_indexable(iterable):
+    # sequences (lists, tuples, str, ...) and indexable buffers (array, memoryview, numpy arrays); mappings and
+    # other objects that merely have __getitem__ go through the iterator path
+    if isinstance(iterable, Sequence):
+        return True
+    if not (hasattr(iterable, '__len__') and hasattr(iterable, '__getitem__')):
+        return False
+    try:
+        memoryview(iterable).release()
+    except TypeError:
+        return False
+    return True
 
 
 class Counter:
+    __slots__ = ('_iterable', '_count')
+
     def __init__(self, iterable, init_value=0):
         self._iterable = iter(iterable)
         self._count = CountObject(init_value)
@@ -20,10 +200,11 @@ class Counter:
 
     def __next__(self):
         value = next(self._iterable)
-        result = (self._count, value)
-        self._count.value += 1
-        self._count.raw += 1
-        return result
+        count = self._count
+        # write the slots directly; the count is always an int here, no conversion needed
+        count._value += 1
+        count._raw += 1
+        return (count, value)
 
     @property
     def count(self):
@@ -34,29 +215,557 @@ class Counter:
         self._count.value = value
 
 
+def make_counter(counter_cls, *args, checkpoint_options=(None, None, None, None), stats_options=(False,), **kwargs):
+    # counter_cls, with the mixins for the requested extras; plain loops get the plain class
+    checkpoint, every, interval, resume_from = checkpoint_options
+    mixins = []
+    if stats_options[0]:
+        mixins.append(StatsMixin)
+    if checkpoint or resume_from:
+        mixins.append(CheckpointMixin)
+    if not mixins:
+        return counter_cls(*args, **kwargs)
+
+    counter = with_mixins(counter_cls, tuple(mixins))(*args, **kwargs)
+    if checkpoint or resume_from:
+        counter.setup_checkpoints(checkpoint, every, interval)
+        if resume_from:
+            counter.resume(resume_from, source=args[0])
+    if stats_options[0]:
+        # after resuming, so stats only cover this run
+        counter.setup_stats(*stats_options)
+    return counter
+
+
+mixed_types = {}
+
+def with_mixins(counter_cls, mixins):
+    # mixins in front of counter_cls; mixin state gets its own slots here, since two slotted bases can't be combined
+    key = (counter_cls, mixins)
+    if key not in mixed_types:
+        name = "".join(mixin.__name__.replace('Mixin', '') for mixin in mixins) + counter_cls.__name__
+        slots = tuple(slot for mixin in mixins for slot in mixin.state_slots)
+        mixed_types[key] = type(name, mixins + (counter_cls,), {'__slots__': slots})
+    return mixed_types[key]
+
+
+class StatsMixin:
+    """
+    throughput and latency tracking. only every `every`th step is timed (from being handed out until the next
+        one is asked for), so untimed steps cost a modulo and a comparison.
+    """
+
+    __slots__ = ()
+    state_slots = ('_stats_every', '_stats_callback', '_stats_interval', '_stats_total', '_stats_started',
+                   '_stats_first_raw', '_stats_timed_at', '_stats_latencies', '_stats_reported')
+
+    def setup_stats(self, every=True, callback=None, interval=1.0, total=None, samples=1024):
+        self._stats_every = 16 if every is True else every
+        self._stats_callback = callback
+        self._stats_interval = interval
+        self._stats_total = total
+        self._stats_started = self._stats_reported = time.perf_counter()
+        self._stats_first_raw = self._count._raw
+        self._stats_timed_at = None
+        self._stats_latencies = deque(maxlen=samples)
+
+    def __next__(self):
+        if self._stats_timed_at is not None:
+            now = time.perf_counter()
+            self._stats_latencies.append(now - self._stats_timed_at)
+            self._stats_timed_at = None
+            if self._stats_callback is not None and now - self._stats_reported >= self._stats_interval:
+                self._stats_reported = now
+                self._stats_callback(self.stats())
+
+        result = super().__next__()
+        if self._count._raw % self._stats_every == 0:
+            self._stats_timed_at = time.perf_counter()
+        return result
+
+    def stats(self):
+        elapsed = time.perf_counter() - self._stats_started
+        done = self._count._raw - self._stats_first_raw
+        rate = done / elapsed if elapsed > 0 else 0.0
+
+        eta = None
+        if self._stats_total is not None and rate:
+            eta = max(self._stats_total - (self._count._raw + 1), 0) / rate
+
+        latencies = sorted(self._stats_latencies)
+        return {
+            'items': done,
+            'elapsed': elapsed,
+            'rate': rate,
+            'eta': eta,
+            'latency': {p: percentile(latencies, p) for p in (50, 90, 99)},
+        }
+
+
+def percentile(sorted_values, p):
+    # nearest rank
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+
+class CheckpointMixin:
+    """
+    saves the count to a json file while iterating, and restores it with resume().
+    a checkpoint is taken when the next item is asked for, so it only ever counts items the loop finished with.
+    """
+
+    __slots__ = ()
+    state_slots = ('_checkpoint_path', '_checkpoint_every', '_checkpoint_interval', '_checkpoint_raw',
+                   '_checkpoint_time')
+
+    def setup_checkpoints(self, path, every=1000, interval=None):
+        self._checkpoint_path = path
+        # resuming without a checkpoint path never saves
+        self._checkpoint_every = every if path else None
+        self._checkpoint_interval = interval if path else None
+        self.schedule_checkpoint()
+
+    def schedule_checkpoint(self):
+        every = self._checkpoint_every
+        # raw is compared against the next due point, so a loop without a due point never checkpoints
+        self._checkpoint_raw = self._count._raw + every if every else float('inf')
+        self._checkpoint_time = time.monotonic() + self._checkpoint_interval if self._checkpoint_interval \
+            else float('inf')
+
+    def __next__(self):
+        if self._count._raw >= self._checkpoint_raw or (self._checkpoint_interval and
+                                                        time.monotonic() >= self._checkpoint_time):
+            self.save_checkpoint()
+        try:
+            return super().__next__()
+        except StopIteration:
+            if self._checkpoint_path:
+                self.save_checkpoint()
+            raise
+
+    def state(self):
+        count = self._count
+        return {'count': count._value, 'raw': count._raw}
+
+    def save_checkpoint(self):
+        # write then rename, so a crash mid-write leaves the previous checkpoint intact
+        temp_path = f"{self._checkpoint_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self.state(), f)
+        os.replace(temp_path, self._checkpoint_path)
+        self.schedule_checkpoint()
+
+    def resume(self, path, source=None):
+        # source = the iterable the counter was made from, so sequences can be started at the right position
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+
+        count = self._count
+        if not isinstance(self, SeekableCounter):
+            # plain counters have read one source item per yield
+            done = state['raw'] + 1
+            if source is not None and is_indexable(source):
+                self._iterable = iter_from(source, done)
+            else:
+                deque(islice(self._iterable, done), maxlen=0)
+        # seekable counters find their position from the count
+        count._value = state['count']
+        count._raw = state['raw']
+        self.schedule_checkpoint()
+
+
+def iter_from(sequence, position):
+    # iterator over sequence starting at position, without reading the items before it
+    iterator = iter(sequence)
+    if hasattr(iterator, '__setstate__'):
+        # the builtin sequence iterators (list, tuple, str, range, array, __getitem__-based) keep their position as state
+        iterator.__setstate__(position)
+        return iterator
+    return map(sequence.__getitem__, range(position, len(sequence)))
+
+
+class AsyncCounter(Counter):
+    # `async for i, x in adjumerate(stream)`; same count object as Counter
+
+    __slots__ = ('_anext',)
+
+    def __init__(self, iterable, init_value=0):
+        self._iterable = iterable.__aiter__()
+        self._anext = self._iterable.__anext__
+        self._count = CountObject(init_value)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        value = await self._anext()
+        count = self._count
+        count._value += 1
+        count._raw += 1
+        return (count, value)
+
+
+class SeekableCounter(Counter):
+    # counters where the count decides the position of the next item
+
+    __slots__ = ('_start',)
+
+    def __init__(self, iterable, init_value=0):
+        super().__init__((), init_value=init_value)
+        self._start = init_value
+
+    def seek(self, position):
+        # make the item at position the next one yielded
+        self._count._value = self._start + position - 1
+
+    def next_position(self):
+        count = self._count
+        count._value += 1
+        position = count._value - self._start
+        if position < 0:
+            count._value -= 1
+            raise IndexError(f"Cannot seek to count {count._value + 1}, before start {self._start}")
+        return position
+
+
+class SequenceCounter(SeekableCounter):
+    # O(1) seeking by indexing the sequence; nothing is copied
+
+    __slots__ = ('_sequence',)
+
+    def __init__(self, sequence, init_value=0):
+        super().__init__(sequence, init_value=init_value)
+        self._sequence = sequence
+
+    def __next__(self):
+        position = self.next_position()
+        try:
+            value = self._sequence[position]
+        except IndexError:
+            self._count._value -= 1
+            raise StopIteration
+        self._count._raw += 1
+        return (self._count, value)
+
+
+class LineCounter(SequenceCounter):
+    # SequenceCounter over a LineFile, which it closes
+
+    __slots__ = ()
+
+    def close(self):
+        self._sequence.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class LineFile:
+    """
+    lines of a file as a read-only sequence of bytes (newlines included, like iterating a binary file).
+    offsets[i] is where line i starts; the last entry is the file size.
+    """
+
+    # saved indexes start with the file's size and mtime, so a stale index is never used
+    header_length = 2
+
+    def __init__(self, path, index_path=None):
+        self._file = open(path, 'rb')
+        stat = os.fstat(self._file.fileno())
+        # mmap refuses empty files
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b''
+
+        header = [stat.st_size, stat.st_mtime_ns]
+        self.offsets = self.load_index(index_path, header) if index_path else None
+        if self.offsets is None:
+            self.offsets = self.build_index()
+            if index_path:
+                self.save_index(index_path, header)
+
+    def build_index(self):
+        data = self._map
+        size = len(data)
+        offsets = array('Q', [0])
+        find = data.find
+        position = find(b'\n')
+        while position != -1:
+            offsets.append(position + 1)
+            position = find(b'\n', position + 1)
+        if offsets[-1] != size:
+            offsets.append(size)  # last line has no newline
+        return offsets
+
+    def load_index(self, index_path, header):
+        try:
+            with open(index_path, 'rb') as f:
+                stored = array('Q')
+                stored.frombytes(f.read())
+        except (OSError, ValueError):
+            return None
+        if list(stored[:self.header_length]) != header:
+            return None
+        return stored[self.header_length:]
+
+    def save_index(self, index_path, header):
+        with open(index_path, 'wb') as f:
+            array('Q', header).tofile(f)
+            self.offsets.tofile(f)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self.offsets) - 1:
+            raise IndexError("line index out of range")
+        return self._map[self.offsets[index]:self.offsets[index + 1]]
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+
+class IteratorSeekCounter(SeekableCounter):
+    # forward seeks skip items in bulk with islice; backward seeks read from a bounded buffer of recent items
+
+    __slots__ = ('_source', '_position', '_recent')
+
+    def __init__(self, iterable, init_value=0, buffer=0):
+        super().__init__(iterable, init_value=init_value)
+        self._source = iter(iterable)
+        self._position = 0  # position of the next item in the source
+        self._recent = deque(maxlen=buffer)
+
+    def __next__(self):
+        position = self.next_position()
+
+        try:
+            if position >= self._position:
+                skip = position - self._position
+                if skip:
+                    self._recent.extend(islice(self._source, skip))
+                value = next(self._source)
+                self._recent.append(value)
+                self._position = position + 1
+            else:
+                back = self._position - position
+                if back > len(self._recent):
+                    raise IndexError(f"Cannot rewind {back} items with a buffer of {self._recent.maxlen}")
+                value = self._recent[-back]
+        except (StopIteration, IndexError):
+            self._count._value -= 1
+            raise
+
+        self._count._raw += 1
+        return (self._count, value)
+
+
+class ChunkCounter(Counter):
+    """
+    yields (index range, chunk) pairs; the count counts chunks. adjust at chunk granularity with
+        repeat() (emit the last chunk again), skip(n) (drop the next n chunks) and resize(size).
+    """
+
+    __slots__ = ('_sequence', '_size', '_start', '_position', '_last', '_repeat', '_skip', '_chunk_buffer')
+
+    def __init__(self, iterable, size, init_value=0, reuse_buffer=False):
+        if size < 1:
+            raise ValueError("chunk size must be at least 1")
+        super().__init__((), init_value=init_value)
+        self._sequence = iterable if is_indexable(iterable) and is_sliceable(iterable) else None
+        self._iterable = iter(iterable) if self._sequence is None else None
+        self._size = size
+        self._start = init_value
+        self._position = 0  # position of the first item of the next chunk
+        self._last = None
+        self._repeat = False
+        self._skip = 0
+        self._chunk_buffer = [] if reuse_buffer else None
+
+    def repeat(self):
+        self._repeat = True
+
+    def skip(self, n=1):
+        self._skip += n
+
+    def resize(self, size):
+        if size < 1:
+            raise ValueError("chunk size must be at least 1")
+        self._size = size
+
+    def take(self):
+        size = self._size
+
+        if self._sequence is not None:
+            if self._skip:
+                self._position += self._skip * size
+                self._skip = 0
+            return self._sequence[self._position:self._position + size]
+
+        if self._skip:
+            skipped = self._skip * size
+            self._skip = 0
+            # consume in bulk without keeping the items
+            deque(islice(self._iterable, skipped), maxlen=0)
+            self._position += skipped
+
+        if self._chunk_buffer is not None:
+            self._chunk_buffer[:] = islice(self._iterable, size)
+            return self._chunk_buffer
+        return list(islice(self._iterable, size))
+
+    def __next__(self):
+        if self._repeat and self._last is not None:
+            self._repeat = False
+            result = self._last
+        else:
+            self._repeat = False
+            chunk = self.take()
+            if not len(chunk):
+                raise StopIteration
+            first = self._start + self._position
+            self._position += len(chunk)
+            result = self._last = (range(first, first + len(chunk)), chunk)
+
+        count = self._count
+        count._value += 1
+        count._raw += 1
+        return result
+
+
+class BlockCounter(SeekableCounter):
+    # blocks of an array along the first axis; no element is boxed into a python object
+
+    __slots__ = ('_array', '_size')
+
+    def __init__(self, array, size, init_value=0):
+        if size < 1:
+            raise ValueError("block size must be at least 1")
+        super().__init__(array, init_value=init_value)
+        self._array = as_blockable(array)
+        self._size = size
+
+    def __next__(self):
+        block = self.next_position()
+        first = block * self._size
+        view = self._array[first:first + self._size]
+        if not len(view):
+            self._count._value -= 1
+            raise StopIteration
+
+        first += self._start
+        if np is not None:
+            indices = np.arange(first, first + len(view))
+        else:
+            indices = range(first, first + len(view))
+        self._count._raw += 1
+        return (indices, view)
+
+
+def as_blockable(array):
+    # ndarrays are sliced as they are; other buffer objects become an ndarray (or memoryview) over the same memory
+    if np is not None:
+        if isinstance(array, np.ndarray):
+            return array
+        return np.asarray(memoryview(array))
+    return memoryview(array)
+
+
+class Prefetcher:
+    # iterator over a source that is read ahead on a background thread into a bounded queue
+
+    def __init__(self, iterable, size):
+        self._queue = queue.Queue(maxsize=size)
+        self._stop = threading.Event()
+        self._finished = False
+        # the thread gets no reference to self, so an abandoned prefetcher is collected and stops it
+        self._thread = threading.Thread(target=Prefetcher.produce, args=(iter(iterable), self._queue, self._stop),
+                                        daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def produce(source, items, stop):
+        def put(entry):
+            # give up if the consumer went away instead of blocking on a full queue forever
+            while not stop.is_set():
+                try:
+                    items.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        try:
+            for item in source:
+                if not put((True, item)):
+                    return
+        except BaseException as e:
+            put((False, e))
+            return
+        put((False, None))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._finished:
+            raise StopIteration
+        ok, value = self._queue.get()
+        if ok:
+            return value
+        self._finished = True
+        if value is None:
+            raise StopIteration
+        raise value
+
+    def close(self):
+        self._stop.set()
+
+    def __del__(self):
+        self.close()
+
+
+def is_sliceable(sequence):
+    # some sequences (eg deque) only take integer indexes
+    try:
+        sequence[0:0]
+    except TypeError:
+        return False
+    return True
+
+
 class CountObject(MutableInteger):
+    # `raw` is read-only from outside; Counter advances it through the `_raw` slot
+    __slots__ = ('_raw',)
+
     def __init__(self, value=0):
         super().__init__(value-1)
-        self.raw = -1
+        self._raw = -1
 
     def unmodified_count(self):
-        return self.raw
-
-    def __setattr__(self, name, value):
-        # Get the caller frame
-        caller_frame = inspect.currentframe().f_back
-        caller_name = caller_frame.f_code.co_name
-        caller_instance = caller_frame.f_locals.get("self")
-
-        # Enforce conditions for `raw` attribute
-        if name == "raw":
-            if caller_name == "__init__" and (caller_instance is not None and isinstance(caller_instance, CountObject)):
-                pass
-            elif caller_name != "__next__" or (caller_instance is not None and not isinstance(caller_instance, Counter)):
-                raise AttributeError("Cannot modify `raw` outside the `__next__` method of the `Counter` class!")
-
-        # Allow other attributes to be set normally
-        super(CountObject, self).__setattr__(name, value)
+        return self._raw
+
+    def snapshot(self):
+        # detached copy of the current count, for results handed out after the counter moved on
+        copy = CountObject.__new__(CountObject)
+        copy._value = self._value
+        copy._raw = self._raw
+        return copy
+
+    @property
+    def raw(self):
+        return self._raw
+
+    @raw.setter
+    def raw(self, value):
+        raise AttributeError("Cannot modify `raw` outside the `__next__` method of the `Counter` class!")
 
 
 
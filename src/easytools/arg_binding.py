@@ -0,0 +1,114 @@
+import inspect
+
+# identity sentinel for unfilled parameters; compared with `is`, never by equality,
+# so user values that override __eq__ (eg arrays) are never compared against it
+MISSING = object()
+
+positional_kinds = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+class SignatureLayout:
+    """
+    Precomputed positional layout of a signature, used to bind call arguments to parameters
+
+    Built once per signature (decoration time) so that calls only fill slots:
+        ```
+        layout = SignatureLayout(inspect.signature(foo), remove_first=True)
+        new_args, new_kwargs = layout.bind(args, kwargs, preseeded={'arg1': 1})
+        ```
+    Binding rules (same as untyped has always used):
+        - slots start as parameter defaults, overridden by preseeded values
+        - keyword arguments naming a positional parameter fill that slot
+        - positional arguments fill the remaining slots in order; extras go to *args if the
+          function has it and are dropped otherwise
+        - other keyword arguments are returned as new_kwargs
+    If a slot is left unfilled, bind returns (None, index of the first unfilled slot).
+    """
+
+    def __init__(self, sig_or_params, remove_first=True):
+        if isinstance(sig_or_params, inspect.Signature):
+            sig_or_params = sig_or_params.parameters
+        params = list(sig_or_params.values())[remove_first:]
+
+        positional = [p for p in params if p.kind in positional_kinds]
+        self.names = tuple(p.name for p in positional)
+        self.defaults = tuple(MISSING if p.default is inspect.Parameter.empty else p.default for p in positional)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.n_required = sum(d is MISSING for d in self.defaults)
+
+        var_positional = [p.name for p in params if p.kind == inspect.Parameter.VAR_POSITIONAL]
+        var_keyword = [p.name for p in params if p.kind == inspect.Parameter.VAR_KEYWORD]
+        self.var_positional = var_positional[0] if var_positional else None
+        self.var_keyword = var_keyword[0] if var_keyword else None
+
+        # first unfilled default at or after each position, for the all-positional fast path
+        self.missing_from = [None] * (len(self.names) + 1)
+        for i in reversed(range(len(self.names))):
+            self.missing_from[i] = i if self.defaults[i] is MISSING else self.missing_from[i + 1]
+
+    def fill(self, preseeded=None):
+        if not preseeded:
+            return list(self.defaults)
+        slots = list(self.defaults)
+        for name, value in preseeded.items():
+            i = self.index.get(name)
+            if i is not None:
+                slots[i] = value
+        return slots
+
+    def bind(self, args, kwargs, preseeded=None):
+        n = len(self.names)
+
+        # fast path: all positional
+        if not kwargs:
+            if not preseeded:
+                if len(args) >= n:
+                    return self.with_extra(list(args[:n]), args[n:]), {}
+                i = self.missing_from[len(args)]
+                if i is not None:
+                    return None, i
+                return list(args) + list(self.defaults[len(args):]), {}
+
+            slots = self.fill(preseeded)
+            slots[:len(args)] = args[:n]
+            return self.finish(slots, args[n:], {})
+
+        slots = self.fill(preseeded)
+
+        # fast path: all keyword
+        if not args:
+            new_kwargs = {}
+            for k, v in kwargs.items():
+                i = self.index.get(k)
+                if i is None:
+                    new_kwargs[k] = v
+                else:
+                    slots[i] = v
+            return self.finish(slots, (), new_kwargs)
+
+        # mixed: keywords take their slots first, positional args fill the rest in order
+        new_kwargs = {}
+        taken = [False] * n
+        for k, v in kwargs.items():
+            i = self.index.get(k)
+            if i is None:
+                new_kwargs[k] = v
+            else:
+                slots[i] = v
+                taken[i] = True
+
+        free = [i for i in range(n) if not taken[i]]
+        for i, a in zip(free, args):
+            slots[i] = a
+        return self.finish(slots, args[len(free):], new_kwargs)
+
+    def finish(self, slots, extra, new_kwargs):
+        for i, v in enumerate(slots):
+            if v is MISSING:
+                return None, i
+        return self.with_extra(slots, extra), new_kwargs
+
+    def with_extra(self, slots, extra):
+        if extra and self.var_positional:
+            slots.extend(extra)
+        return slots
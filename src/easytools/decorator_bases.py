@@ -51,14 +51,53 @@ class StaticOrInstanceDecorator(OptionalParenthesesDecorator):
         self.instance = None
         self.owner = None
 
+        # decorator layer directly beneath this one when decorators are stacked
+        self.inner = None
+        # (is_instance_call, owner) -> endpoint, so the whole stack is prepared once per context and class
+        self.endpoints = {}
+        layer = self.as_layer(func)
+        if layer is not None:
+            self.fuse(layer)
+
     class get_exposer:
         def __init__(self, get_endpoint_callable):
             self.get_endpoint = get_endpoint_callable
+            self.decorator = getattr(get_endpoint_callable, '__self__', None)
         
         def __get__(self, instance, owner):
             return self.get_endpoint(instance, owner)
-    
-    def get_endpoint(self, instance, owner):
+
+    @staticmethod
+    def as_layer(obj):
+        # return the decorator behind obj if obj is a (possibly exposed) StaticOrInstanceDecorator
+        if isinstance(obj, StaticOrInstanceDecorator):
+            return obj
+        if isinstance(obj, StaticOrInstanceDecorator.get_exposer) and isinstance(obj.decorator, StaticOrInstanceDecorator):
+            return obj.decorator
+        return None
+
+    def fuse(self, layer):
+        """
+        Stack on top of another decorator layer. Instead of going through the inner layer's own 
+            get_endpoint -> bound_wrapper -> wrapper chain on every call, this layer's func becomes the 
+            inner layer's wrapper, and the outermost layer prepares every layer from a single get_endpoint.
+            All layers share the signature analysis of the original function.
+        """
+        self.inner = layer
+        self.func = layer.wrapper
+
+    @property
+    def root_func(self):
+        # original undecorated function at the bottom of the stack
+        if self.inner is not None:
+            return self.inner.root_func
+        return self.func
+
+    def prepare_endpoint(self, instance, owner):
+        # prepare layers beneath first, so outer layers can override their metadata
+        if self.inner is not None:
+            self.inner.prepare_endpoint(instance, owner)
+
         self.flags['is_instance_call'] = instance is not None
         self.instance = instance
         self.owner = owner
@@ -68,7 +107,9 @@ class StaticOrInstanceDecorator(OptionalParenthesesDecorator):
         self.modify_meta()
         self.apply_meta_changes()
 
-        @wraps(self.func)
+    def make_endpoint(self, instance, owner):
+        # called once per (is_instance_call, owner), right after prepare_endpoint; the result is cached
+        @wraps(self.root_func)
         def bound_wrapper(*args, **kwargs):
             """ not needed, as get_endpoint always called via get
             if instance:
@@ -81,6 +122,23 @@ class StaticOrInstanceDecorator(OptionalParenthesesDecorator):
 
         return bound_wrapper
     
+    def get_endpoint(self, instance, owner):
+        is_instance_call = instance is not None
+        endpoint = self.endpoints.get((is_instance_call, owner))
+        if endpoint is None:
+            self.prepare_endpoint(instance, owner)
+            endpoint = self.endpoints[(is_instance_call, owner)] = self.make_endpoint(instance, owner)
+            return endpoint
+
+        # already prepared for this context and class; the wrappers only need to know who they are called on
+        layer = self
+        while layer is not None:
+            layer.flags['is_instance_call'] = is_instance_call
+            layer.instance = instance
+            layer.owner = owner
+            layer = layer.inner
+        return endpoint
+    
     def __get__(self, instance, owner):
         return self.get_endpoint(instance, owner)
 
@@ -89,6 +147,9 @@ class StaticOrInstanceDecorator(OptionalParenthesesDecorator):
             if self.func is not None:
                 self.decorator_args = tuple([self.func]) + self.decorator_args
             self.func = args[0]
+            layer = self.as_layer(self.func)
+            if layer is not None:
+                self.fuse(layer)
             if not callable(self.func):
                 raise TypeError(f'{self.__class__.__name__} can only be applied to callables')
             self.flags['was_called_with_parentheses'] = True
@@ -126,6 +187,9 @@ class MetaModifyingDecorator(StaticOrInstanceDecorator):
     
     @property
     def func_signature(self):
+        if self.inner is not None:
+            # stacked layers share one signature analysis of the original function
+            return self.inner.func_signature
         if '_func_signature' not in self.__dict__:
             self._func_signature = inspect.signature(self.func)
         return self._func_signature
@@ -134,7 +198,7 @@ class MetaModifyingDecorator(StaticOrInstanceDecorator):
         for key, value in self.meta.items():
             if key == '__signature__':
                 self.func_signature
-            setattr(self.func, key, value)
+            setattr(self.root_func, key, value)
 
 '''
     def __call__(self, *args, **kwargs):
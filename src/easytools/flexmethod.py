@@ -1,18 +1,69 @@
-from functools import wraps, update_wrapper
+from functools import wraps, update_wrapper, partial
+from collections import namedtuple
+from types import MethodType
 import inspect
 import textwrap
 from easytools.inspect_tools import has_var_keyword, get_positional_params, get_default_kwargs, get_var_params
-from typing import Dict, Tuple, Union, List, Any, Callable, Type, Literal, Optional
+from typing import Dict, Tuple, Union, List, Any, Callable, Type, Literal, Optional, get_type_hints, get_origin, get_args
+try:
+    from types import UnionType
+except ImportError:
+    UnionType = Union
 from easytools.decorator_bases import EasyDecorator
+from easytools.arg_binding import SignatureLayout, MISSING
 import logging
 
 logging.basicConfig(format='%(levelname)s:%(message)s', level=logging.WARNING)
 
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+class CallShapeCache:
+    """
+    Inline cache of argument routing plans
+
+    Call sites tend to repeat the same shape (number of positional args, names of kwargs), so parsers
+        store the plan computed for a shape here and reuse it instead of classifying every argument
+        again. Bounded to maxsize plans; the oldest plan is dropped when full.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.plans = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, shape):
+        plan = self.plans.get(shape)
+        if plan is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return plan
+
+    def put(self, shape, plan):
+        if len(self.plans) >= self.maxsize:
+            del self.plans[next(iter(self.plans))]
+        self.plans[shape] = plan
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.plans))
+
+    def clear(self):
+        self.plans.clear()
+        self.hits = 0
+        self.misses = 0
+
 class ArgumentParser:
+    # parsers route each argument of a static call to either the namespace or the function, so they keep
+    # their own classification (cached per call shape in make_plan) instead of SignatureLayout.bind, which
+    # binds a call against a single signature. the layout is only used where that is what is needed:
+    # bind() and overload registration.
 
     _for: Literal['static', 'instance', 'static or instance', ''] = ''
+    shape_cache_size = 32
     
     def __init__(self, func, static_params, static_defaults, func_params, func_defaults, func_vars, default_signature=None):
+        self.shape_cache = CallShapeCache(self.shape_cache_size)
         self.func = func
         self.static_params = static_params
         self.static_defaults = static_defaults
@@ -33,6 +84,11 @@ class ArgumentParser:
 
     def __call__(self, args, kwargs) -> Tuple[Union[Dict,Any], List, Dict[str,Any]]:
         raise NotImplementedError()
+
+    def bind(self, args, kwargs) -> Tuple[Union[Dict,Any], Dict[str,Any]]:
+        # resolve only the namespace half of a static call, ahead of time.
+        # returns the namespace and any kwargs that must be passed to func on every call
+        raise NotImplementedError()
     
     def create_instance_signature(self) -> inspect.Signature:
         if self.default_signature:
@@ -70,6 +126,12 @@ class DummyParser(ArgumentParser):
     def __call__(self, args, kwargs): 
 
         return args[0], args[1:], kwargs
+
+    def bind(self, args, kwargs):
+        if len(args) != 1 or kwargs:
+            raise TypeError(f"{self.func.__name__}.bind() takes exactly 1 namespace argument")
+
+        return args[0], {}
     
     @classmethod
     def condition_check(cls, decorator_args, decorator_kwargs, func_params, func_defaults):
@@ -145,38 +207,59 @@ class SignatureInjectParser(ArgumentParser):
         
     def __call__(self, args, kwargs):
         # create a dummy instance with the provided nmsp_attrs
+
+        shape = (len(args), tuple(kwargs))
+        plan = self.shape_cache.get(shape)
+        if plan is None:
+            plan = self.make_plan(*shape)
+            self.shape_cache.put(shape, plan)
+        idx, func_keys, nmsp_keys = plan
         
         # divide args into func args and namespace attributes
-        idx = len(self.static_params)
         nmsp_dict = dict(zip(self.static_params, args[:idx]))
-        idx = len(nmsp_dict)
         nmsp_dict.update(self.static_defaults)
 
         new_args = args[idx:]
+
+        # map to function kwargs or to namespace attrs, as sorted by the plan
+        new_kwargs = {k: kwargs[k] for k in func_keys}
+        for k, nmsp_k in nmsp_keys:
+            nmsp_dict[nmsp_k] = kwargs[k]
         
+        #logging.info('nmsp_dict new: %s', nmsp_dict)
+        #logging.info('new args: %s', new_args)
+        #logging.info('new kwargs: %s', new_kwargs)
+
+        return nmsp_dict, new_args, new_kwargs
+
+    def make_plan(self, n_args, kw_names):
+        # routing plan for one call shape: number of positional args that go to the namespace,
+        # kwargs that go to the function, and (kwarg, namespace attr) pairs
+        idx = min(n_args, len(self.static_params))
 
         # filter and map to function kwargs or to namespace attrs
 
-        new_kwargs = {}
-        for k, v in kwargs.items():
+        func_keys = []
+        nmsp_keys = []
+        for k in kw_names:
             if k in self.func_params:
                 #logging.info(f'[ksort] {k} in self.func_params')
-                new_kwargs[k] = v
+                func_keys.append(k)
             elif k in self.static_params:
                 #logging.info(f'[ksort] {k} in self.static_params')
-                nmsp_dict[k] = v
+                nmsp_keys.append((k, k))
             elif k in self.static_defaults:
                 #logging.info(f'[ksort] {k} in self.static_defaults')
-                nmsp_dict[k] = v
+                nmsp_keys.append((k, k))
             elif k in self.func_defaults:
                 #logging.info(f'[ksort] {k} in self.func_defaults')
-                new_kwargs[k] = v
+                func_keys.append(k)
             elif k[:len(self.n_p)] == self.n_p:
                 #logging.info(f'[ksort] {k} has prefix {self.n_p}')
-                nmsp_dict[k[len(self.n_p):]] = v
+                nmsp_keys.append((k, k[len(self.n_p):]))
             elif has_var_keyword(self.static_signature):
                 #if func has ** term, lets put this kw in there
-                new_kwargs[k] = v
+                func_keys.append(k)
 
             else:
                 """
@@ -194,17 +277,32 @@ class SignatureInjectParser(ArgumentParser):
                     creating dummy instances. {self.static_signature}
                 """).split())
                 raise TypeError(conflictmsg)
-        
-        logging.info('at call:')
-        logging.info(self.func_defaults)
-        logging.info(self.func_params)
-        logging.info(self.static_defaults)
-                
-        logging.info(f"nmsp_dict new: {nmsp_dict}")
-        logging.info(f"new args: {new_args}")
-        logging.info(f"new kwargs: {new_kwargs}")
 
-        return nmsp_dict, new_args, new_kwargs
+        return idx, tuple(func_keys), tuple(nmsp_keys)
+
+    def bind(self, args, kwargs):
+        if len(args) > len(self.static_params):
+            raise TypeError(f"{self.func.__name__}.bind() takes at most {len(self.static_params)} positional namespace argument{'s' if len(self.static_params) != 1 else ''}, got {len(args)}")
+
+        nmsp_dict = dict(zip(self.static_params, args))
+        for k, v in self.static_defaults.items():
+            nmsp_dict.setdefault(k, v)
+
+        # every keyword passed to bind belongs to the namespace
+        for k, v in kwargs.items():
+            if k in self.static_params or k in self.static_defaults:
+                nmsp_dict[k] = v
+            elif k[:len(self.n_p)] == self.n_p:
+                nmsp_dict[k[len(self.n_p):]] = v
+            else:
+                raise TypeError(f"{self.func.__name__}.bind() got an unexpected namespace argument '{k}'")
+
+        bound = {k[len(self.n_p):] if k[:len(self.n_p)] == self.n_p else k for k in nmsp_dict}
+        missing = [k for k in self.static_params if (k[len(self.n_p):] if k[:len(self.n_p)] == self.n_p else k) not in bound]
+        if missing:
+            raise TypeError(f"{self.func.__name__}.bind() missing namespace argument(s): {', '.join(missing)}")
+
+        return nmsp_dict, {}
     
     def create_static_signature(self):
 
@@ -255,30 +353,62 @@ class FullSignatureParser(ArgumentParser):
     def __call__(self, args, kwargs):
         # full static signature defined in decorator args
 
-        new_kwargs = {}
-        nmsp_attrs = {}
+        shape = (len(args), tuple(kwargs))
+        plan = self.shape_cache.get(shape)
+        if plan is None:
+            plan = self.make_plan(*shape)
+            self.shape_cache.put(shape, plan)
+        func_keys, nmsp_keys, arg_routes, default_routes = plan
+
+        new_kwargs = {k: kwargs[k] for k in func_keys}
+        nmsp_attrs = {k: kwargs[k] for k in nmsp_keys}
+
+        for (param, to_func), a in zip(arg_routes, args):
+            if to_func:
+                new_kwargs[param] = a
+            else:
+                nmsp_attrs[param] = a
+
+        for k, v, to_func in default_routes:
+            if to_func:
+                new_kwargs[k] = v
+            else:
+                nmsp_attrs[k] = v
+
+        #logging.info(f"nmsp_attrs new: {nmsp_attrs}")
+        #logging.info(f"new args: {()}")
+        #logging.info(f"new kwargs: {new_kwargs}")
+
+        return nmsp_attrs, [], new_kwargs
+
+    def make_plan(self, n_args, kw_names):
+        # routing plan for one call shape: kwargs for the function, kwargs for the namespace,
+        # (param, to func) for each positional arg, and (key, default, to func) for unfilled static defaults
+        func_keys = []
+        nmsp_keys = []
+        arg_routes = []
         p = 0
 
-        for k, v in kwargs.items():
+        for k in kw_names:
             if k in self.func_defaults.keys():
-                new_kwargs[k] = v
+                func_keys.append(k)
             elif k in self.func_params:
-                new_kwargs[k] = v
+                func_keys.append(k)
                 p += 1
             else:
-                nmsp_attrs[k] = v
+                nmsp_keys.append(k)
         
-        for i, a in enumerate(args):
+        for i in range(n_args):
             if i < len(self.static_params):
                 param = self.static_params[i]
             else:
                 param = list(self.static_defaults.keys())[i - len(self.static_params)]
             
             if param in self.func_params:
-                new_kwargs[param] = a
+                arg_routes.append((param, True))
                 p += 1
             else:
-                nmsp_attrs[param] = a
+                arg_routes.append((param, False))
         
         if p != len(self.func_params):
             msg = " ".join(textwrap.dedent(f"""
@@ -288,19 +418,43 @@ class FullSignatureParser(ArgumentParser):
                 """).split())
             raise TypeError(msg)
 
-        for k, v in self.static_defaults.items():
-            if k not in new_kwargs.keys() and k not in nmsp_attrs.keys():
-                if k in self.func_defaults.keys():
-                    new_kwargs[k] = v
-                else:
-                    nmsp_attrs[k] = v
-        
+        filled = set(kw_names) | {param for param, _ in arg_routes}
+        default_routes = tuple(
+            (k, v, k in self.func_defaults.keys())
+            for k, v in self.static_defaults.items() if k not in filled
+        )
 
-        #logging.info(f"nmsp_attrs new: {nmsp_attrs}")
-        #logging.info(f"new args: {()}")
-        #logging.info(f"new kwargs: {new_kwargs}")
+        return tuple(func_keys), tuple(nmsp_keys), tuple(arg_routes), default_routes
 
-        return nmsp_attrs, [], new_kwargs
+    def bind(self, args, kwargs):
+        # only the static parameters that are not function parameters belong to the namespace
+        is_func_param = lambda k: k in self.func_params or k in self.func_defaults
+        nmsp_params = [k for k in self.static_params if not is_func_param(k)]
+        nmsp_defaults = {k: v for k, v in self.static_defaults.items() if not is_func_param(k)}
+        nmsp_names = nmsp_params + list(nmsp_defaults.keys())
+
+        if len(args) > len(nmsp_names):
+            raise TypeError(f"{self.func.__name__}.bind() takes at most {len(nmsp_names)} positional namespace argument{'s' if len(nmsp_names) != 1 else ''}, got {len(args)}")
+
+        nmsp_attrs = dict(nmsp_defaults)
+        nmsp_attrs.update(zip(nmsp_names, args))
+
+        for k, v in kwargs.items():
+            if k in nmsp_names:
+                nmsp_attrs[k] = v
+            elif k[:len(self.n_p)] == self.n_p and k[len(self.n_p):] in nmsp_names:
+                nmsp_attrs[k[len(self.n_p):]] = v
+            else:
+                raise TypeError(f"{self.func.__name__}.bind() got an unexpected namespace argument '{k}'")
+
+        missing = [k for k in nmsp_params if k not in nmsp_attrs]
+        if missing:
+            raise TypeError(f"{self.func.__name__}.bind() missing namespace argument(s): {', '.join(missing)}")
+
+        # static defaults given for function parameters still apply to every call
+        fixed_kwargs = {k: v for k, v in self.static_defaults.items() if is_func_param(k)}
+
+        return nmsp_attrs, fixed_kwargs
     
     @classmethod
     def condition_check(cls, decorator_args, decorator_kwargs, func_params, func_defaults):
@@ -356,6 +510,10 @@ class ArgumentParsingDecorator(EasyDecorator):
         self.parsers = None
     
     def user_init(self):
+        # parser only depends on the decorated function and decorator arguments; build it once so
+        # its call shape cache survives attribute access
+        if self.__dict__.get('prepare_args') is not None:
+            return
         
         logging.info('initing')
 
@@ -377,7 +535,7 @@ class ArgumentParsingDecorator(EasyDecorator):
                 logging.info(self.decorator_kwargs)
                 logging.info(self.func_params)
                 logging.info(self.func_defaults)
-                self.prepare_args = parser(self.func, self.decorator_args, self.decorator_kwargs, self.func_params, self.func_defaults, self.func_vars, self.func_signature)
+                self.prepare_args = parser(self.root_func, self.decorator_args, self.decorator_kwargs, self.func_params, self.func_defaults, self.func_vars, self.func_signature)
                 break
         
         if self.prepare_args is None:
@@ -422,25 +580,30 @@ class ArgumentParsingDecorator(EasyDecorator):
     
     def wrapper(self, *args, **kwargs):
         
-        logging.info("wrapper called")
+        #logging.info("wrapper called")
         #default wrapper for this class is meant for static, override for inst
-        logging.info(self.__dict__)
+        #logging.info(self.__dict__)
 
         if self.flags['is_instance_call']:
             #instance call just calls function in default wrapper
             
-            logging.info(args)
-            logging.info(kwargs)
-            self.instance.__dict__.update({'__static_from_flexmethod__': False})
+            #logging.info(args)
+            #logging.info(kwargs)
+            self.instance.__dict__['__static_from_flexmethod__'] = False
             return self.func(self.instance, *args, **kwargs)
         
         #otherwise is static call
         nmsp_attrs, new_args, new_kwargs = self.prepare_args(args, kwargs)
-        logging.info('passed')
+        #logging.info('passed')
+
+        nself = self.make_nself(nmsp_attrs, self.owner)
+        
+        return self.func(nself, *new_args, **new_kwargs)
 
+    def make_nself(self, nmsp_attrs, owner):
         #returned dict representing nself namespace
         if isinstance(nmsp_attrs, dict):
-            logging.info('was instance called')
+            #logging.info('was instance called')
             # remove nmsp tags
             to_proc = []
             for k, v in nmsp_attrs.items():
@@ -455,18 +618,55 @@ class ArgumentParsingDecorator(EasyDecorator):
             nmsp_attrs['__static_from_flexmethod__'] = True
 
             # make dummy instance that will act as nself namespace
-            nself = self.owner.__new__(self.owner)
+            nself = owner.__new__(owner)
             nself.__dict__.update(nmsp_attrs)
 
-            return self.func(nself, *new_args, **new_kwargs)
+            return nself
         
         # arg preparer returned the nself namespace
-        else:
-            nmsp_attrs.__dict__.update({'__static_from_flexmethod__': True})
-
-            nself = nmsp_attrs
-        
-        return self.func(nself, *new_args, **new_kwargs)
+        nmsp_attrs.__dict__.update({'__static_from_flexmethod__': True})
+
+        return nmsp_attrs
+
+    def bind(self, owner, *args, **kwargs):
+        """
+        Pre-build the namespace and return a callable that only takes the function's own arguments.
+            Exposed on static endpoints as `MyClass.foo.bind(...)`. Namespace parsing and dummy
+            instance creation happen once here instead of on every call, so the same nself
+            is shared by every call to the returned callable.
+        """
+        nmsp_attrs, fixed_kwargs = self.prepare_args.bind(args, kwargs)
+        nself = self.make_nself(nmsp_attrs, owner)
+
+        if not fixed_kwargs:
+            return MethodType(self.func, nself)
+
+        # positional arguments given at call time take precedence over fixed kwargs of the same name
+        positional = SignatureLayout(self.func_signature, remove_first=True).names
+        kwargs_by_nargs = [
+            {k: v for k, v in fixed_kwargs.items() if k not in positional[:n]}
+            for n in range(len(positional) + 1)
+        ]
+        func = self.func
+
+        @wraps(func)
+        def bound(*args, **kwargs):
+            fixed = kwargs_by_nargs[min(len(args), len(positional))]
+            if kwargs:
+                fixed = {**fixed, **kwargs}
+            return func(nself, *args, **fixed)
+
+        return bound
+
+    def make_endpoint(self, instance, owner):
+        endpoint = super().make_endpoint(instance, owner)
+        # static only: instance endpoints are shared by every instance of the owner, and an instance
+        # already is its namespace
+        if instance is None:
+            endpoint.bind = partial(self.bind, owner)
+        endpoint.cache_info = self.prepare_args.shape_cache.info
+        endpoint.cache_clear = self.prepare_args.shape_cache.clear
+        return endpoint
     
     def modify_meta(self):
         if not self.flags['is_instance_call'] and self.prepare_args._for == 'static':
@@ -550,4 +750,173 @@ class flexmethod(ArgumentParsingDecorator):
         # Convert static method code to be callable in instance (static to instance)
         # Call with @flexmethod.parambind
         pass
-    
\ No newline at end of file
+
+    # Overload Mode
+    class overload(EasyDecorator):
+        # Registers several implementations under one name. The implementation is chosen by the call context
+        # (static or instance) and by the types of the arguments, like functools.singledispatch over every
+        # argument; keyword arguments are matched to each implementation's parameters by name. Resolved
+        # implementations are cached per (context, *arg types) (plus keyword names and types), so repeated
+        # calls with the same argument types cost one dict lookup.
+        # When called statically, nself is an empty dummy instance of the owner.
+        # Call with @flexmethod.overload, then add implementations with @name.register or @name.register('static')
+
+        contexts = ('static', 'instance', 'static or instance')
+
+        def __init__(self, func=None, *args, **kwargs):
+            super().__init__(func, *args, **kwargs)
+            if not callable(func) or args or kwargs:
+                raise SyntaxError('flexmethod.overload does not take arguments; use @name.register(context) to set the context of an implementation.')
+
+            self.implementations = []
+            self.dispatch_cache = {}
+            # some implementations have annotations that can only be resolved once the owner exists
+            self.pending = False
+            self.register(func)
+
+        def register(self, func=None, context='static or instance'):
+            """
+            register an implementation. use as @name.register, or @name.register(context) where context is one
+                of 'static', 'instance' or 'static or instance'. argument types are read from the annotations
+                of the parameters after nself; unannotated parameters match any type, generics match their origin
+                (List[int] matches any list) and unions match any of their members. annotations naming the owner
+                class are resolved on the first call.
+            """
+            if isinstance(func, str) or func is None:
+                context = func or context
+                return lambda f: self.register(f, context)
+
+            if context not in self.contexts:
+                raise ValueError(f"Unknown overload context '{context}'; use one of {', '.join(self.contexts)}")
+
+            layout = SignatureLayout(inspect.signature(func), remove_first=True)
+            n_max = float('inf') if layout.var_positional else len(layout.names)
+            try:
+                types, keyword_only = self.read_hints(func, layout)
+            except NameError:
+                # forward reference, usually to the class being defined; resolved on first dispatch,
+                # when the owner exists
+                types = keyword_only = None
+                self.pending = True
+
+            self.implementations.append((func, context, types, layout, n_max, keyword_only))
+            self.dispatch_cache.clear()
+
+            return self
+
+        def read_hints(self, func, layout, localns=None):
+            # classes accepted by each positional parameter after nself, and keyword-only
+            # parameters as name -> (classes, required)
+            hints = get_type_hints(func, localns=localns)
+            classes = lambda name: self.hint_classes(func, hints[name]) if name in hints else (object,)
+
+            types = tuple(classes(name) for name in layout.names)
+            keyword_only = {p.name: (classes(p.name), p.default is inspect.Parameter.empty)
+                            for p in inspect.signature(func).parameters.values() if p.kind == inspect.Parameter.KEYWORD_ONLY}
+            return types, keyword_only
+
+        @classmethod
+        def hint_classes(cls, func, hint):
+            # annotation -> tuple of classes for issubclass; generics dispatch on their origin (List[int] -> list)
+            # and Union/Optional on each member
+            if hint is Any:
+                return (object,)
+            if isinstance(hint, type):
+                return (hint,)
+            origin = get_origin(hint)
+            if origin is Union or origin is UnionType:
+                return tuple(c for arg in get_args(hint) for c in cls.hint_classes(func, arg))
+            if isinstance(origin, type):
+                return (origin,)
+            raise TypeError(f"{func.__qualname__}(): can't dispatch on annotation {hint!r}; annotate with classes, generics or unions of them")
+
+        def resolve_pending(self):
+            localns = {self.owner.__name__: self.owner}
+            for n, (func, context, types, layout, n_max, keyword_only) in enumerate(self.implementations):
+                if types is None:
+                    try:
+                        types, keyword_only = self.read_hints(func, layout, localns)
+                    except NameError as e:
+                        raise TypeError(f"{func.__qualname__}(): can't resolve annotation: {e}") from None
+                    self.implementations[n] = (func, context, types, layout, n_max, keyword_only)
+            self.pending = False
+
+        @staticmethod
+        def match_hints(types, layout, n_max, keyword_only, arg_types, kwarg_types):
+            # annotation for every argument given, or None if the implementation can't take these arguments
+            if len(arg_types) > n_max:
+                return None
+            hints = list(types[:len(arg_types)])
+
+            filled = set(range(min(len(arg_types), len(layout.names))))
+            for name, t in kwarg_types:
+                i = layout.index.get(name)
+                if i is None:
+                    if name in keyword_only:
+                        hints.append(keyword_only[name][0])
+                    elif layout.var_keyword is None:
+                        return None
+                    else:
+                        hints.append((object,))
+                elif i in filled:
+                    return None
+                else:
+                    filled.add(i)
+                    hints.append(types[i])
+
+            if any(default is MISSING and i not in filled for i, default in enumerate(layout.defaults)):
+                return None
+            given = {name for name, t in kwarg_types}
+            if any(required and name not in given for name, (hint, required) in keyword_only.items()):
+                return None
+            return hints
+
+        def resolve(self, is_instance_call, arg_types, kwarg_types=()):
+            context = 'instance' if is_instance_call else 'static'
+            if self.pending:
+                self.resolve_pending()
+            given = list(arg_types) + [t for name, t in kwarg_types]
+            best, best_score = None, None
+
+            for func, impl_context, types, layout, n_max, keyword_only in self.implementations:
+                if context not in impl_context:
+                    continue
+                hints = self.match_hints(types, layout, n_max, keyword_only, arg_types, kwarg_types)
+                if hints is None or not all(issubclass(t, hint) for t, hint in zip(given, hints)):
+                    continue
+
+                # prefer the implementation whose annotations are closest in each argument's mro
+                score = sum(min((t.__mro__.index(c) for c in hint if c in t.__mro__), default=len(t.__mro__))
+                            for t, hint in zip(given, hints))
+                if best_score is None or score < best_score:
+                    best, best_score = func, score
+
+            if best is None:
+                described = [t.__name__ for t in arg_types] + [f"{name}={t.__name__}" for name, t in kwarg_types]
+                raise TypeError(f"{self.root_func.__name__}() has no {context} implementation for argument types ({', '.join(described)})")
+
+            return best
+
+        def dispatch(self, is_instance_call, args, kwargs=None):
+            if kwargs:
+                kwarg_types = tuple((name, type(value)) for name, value in kwargs.items())
+                key = (is_instance_call, kwarg_types, *map(type, args))
+            else:
+                kwarg_types = ()
+                key = (is_instance_call, *map(type, args))
+            try:
+                return self.dispatch_cache[key]
+            except KeyError:
+                arg_types = key[2:] if kwarg_types else key[1:]
+                func = self.dispatch_cache[key] = self.resolve(is_instance_call, arg_types, kwarg_types)
+                return func
+
+        def wrapper(self, *args, **kwargs):
+            if self.flags['is_instance_call']:
+                self.instance.__dict__['__static_from_flexmethod__'] = False
+                return self.dispatch(True, args, kwargs)(self.instance, *args, **kwargs)
+
+            nself = self.owner.__new__(self.owner)
+            nself.__dict__['__static_from_flexmethod__'] = True
+
+            return self.dispatch(False, args, kwargs)(nself, *args, **kwargs)
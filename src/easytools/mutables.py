@@ -1,13 +1,24 @@
+from array import array
+import multiprocessing
+from multiprocessing import shared_memory
+import threading
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 class MutableInteger:
+    # slotted, and every operator works on `_value` directly rather than converting through int(self)
+    __slots__ = ('_value',)
 
     def __init__(self, value=0):
         self._value = value
 
     def __repr__(self):
-        return int(self._value)
-
-    def __str__(self):
-        return str(int(self._value))
+        return f"{type(self).__name__}({self._value!r})"
 
     def __int__(self):
         return int(self._value)
@@ -40,102 +51,102 @@ class MutableInteger:
 
     # Arithmetic methods:
     def __add__(self, other):
-        return int(self).__add__(other)
+        return self._value + other
 
     def __sub__(self, other):
-        return int(self).__sub__(other)
+        return self._value - other
 
     def __mul__(self, other):
-        return int(self).__mul__(other)
+        return self._value * other
 
     def __truediv__(self, other):
-        return int(self).__truediv__(other)
+        return self._value / other
 
     def __floordiv__(self, other):
-        return int(self).__floordiv__(other)
+        return self._value // other
 
     def __mod__(self, other):
-        return int(self).__mod__(other)
+        return self._value % other
 
     def __pow__(self, power, modulo=None):
         if modulo is None:
-            return int(self).__pow__(power)
-        return int(self).__pow__(power, modulo)
+            return self._value ** power
+        return pow(self._value, power, modulo)
 
     # Bitwise operations:
 
     def __lshift__(self, other):
-        return int(self).__lshift__(other)
+        return self._value << other
 
     def __rshift__(self, other):
-        return int(self).__rshift__(other)
+        return self._value >> other
 
     def __and__(self, other):
-        return int(self).__and__(other)
+        return self._value & other
 
     def __xor__(self, other):
-        return int(self).__xor__(other)
+        return self._value ^ other
 
     def __or__(self, other):
-        return int(self).__or__(other)
+        return self._value | other
 
     # Reverse arithmetic methods for operations where `MutableInteger` is the right operand:
 
     def __radd__(self, other):
-        return other + int(self)
+        return other + self._value
 
     def __rsub__(self, other):
-        return other - int(self)
+        return other - self._value
 
     def __rmul__(self, other):
-        return other * int(self)
+        return other * self._value
 
     def __rtruediv__(self, other):
-        return other / int(self)
+        return other / self._value
 
     def __rfloordiv__(self, other):
-        return other // int(self)
+        return other // self._value
 
     def __rmod__(self, other):
-        return other % int(self)
+        return other % self._value
 
     def __rpow__(self, base):
-        return base ** int(self)
+        return base ** self._value
 
     def __rlshift__(self, other):
-        return other << int(self)
+        return other << self._value
 
     def __rrshift__(self, other):
-        return other >> int(self)
+        return other >> self._value
 
     def __rand__(self, other):
-        return other & int(self)
+        return other & self._value
 
     def __rxor__(self, other):
-        return other ^ int(self)
+        return other ^ self._value
 
     def __ror__(self, other):
-        return other | int(self)
+        return other | self._value
 
     # Comparison methods:
 
     def __lt__(self, other):
-        return int(self).__lt__(other)
+        return self._value < other
 
     def __le__(self, other):
-        return int(self).__le__(other)
+        return self._value <= other
 
     def __eq__(self, other):
-        return int(self).__eq__(other)
+        return self._value == other
 
     def __ne__(self, other):
-        return int(self).__ne__(other)
+        return self._value != other
 
     def __gt__(self, other):
-        return int(self).__gt__(other)
+        return self._value > other
 
     def __ge__(self, other):
-        return int(self).__ge__(other)
+        return self._value >= other
 
     # Conversion methods:
 
@@ -168,4 +179,352 @@ class MutableInteger:
         return divmod(self._value, other)
 
     def __index__(self):
-        return int(self)
+        return int(self._value)
+
+
+class AtomicInteger(MutableInteger):
+    """
+    MutableInteger that can be shared between threads.
+
+    `+=` on a MutableInteger reads, adds and writes back as separate steps, so two threads can read the same
+        value and one increment is lost. with the GIL that's rare (it depends on where the interpreter switches
+        threads, which changes between versions), on free-threaded (no-GIL) builds it's routine. here every
+        read-modify-write holds a lock:
+        - `+=`, `-=`, set(), the value setter, fetch_add(), get_and_set() and compare_and_set() are atomic,
+          on both GIL and free-threaded interpreters
+        - reads (int(), comparisons, arithmetic like `a + 1`) don't lock; they see a value some update left,
+          never a half-written one, but it can be out of date by the time it's used
+        - so `a.value = a + 1` is NOT atomic (a read, then a separate write). use `a += 1` or a.fetch_add(1)
+    """
+    __slots__ = ('_lock',)
+
+    def __init__(self, value=0):
+        super().__init__(value)
+        self._lock = threading.Lock()
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, new_value):
+        new_value = int(new_value)
+        with self._lock:
+            self._value = new_value
+
+    def set(self, value):
+        if not isinstance(value, int):
+            raise ValueError("MutableInteger value must be an integer")
+        with self._lock:
+            self._value = value
+
+    def fetch_add(self, delta=1):
+        # add delta, returning the value from before
+        with self._lock:
+            old = self._value
+            self._value = old + delta
+        return old
+
+    def get_and_set(self, value):
+        with self._lock:
+            old = self._value
+            self._value = value
+        return old
+
+    def compare_and_set(self, expected, value):
+        # set to value only if the current value is expected; returns whether it was set
+        with self._lock:
+            if self._value != expected:
+                return False
+            self._value = value
+            return True
+
+    def __iadd__(self, value):
+        if isinstance(value, int):
+            with self._lock:
+                self._value += value
+            return self
+        raise ValueError("Can only add integers to MutableInteger")
+
+    def __isub__(self, value):
+        if isinstance(value, int):
+            with self._lock:
+                self._value -= value
+            return self
+        raise ValueError("Can only subtract integers to MutableInteger")
+
+
+class ShardedCounter(MutableInteger):
+    """
+    MutableInteger for counters incremented from many threads at once. each thread adds into its own stripe, so
+        `+=` and `-=` never wait on a lock (and never lose updates); reading the value sums the stripes.
+    cache_ttl = if set, reads reuse the last sum for this many seconds, for counters read about as often as
+        they are incremented. the total can then be up to cache_ttl seconds out of date.
+    setting the value (set(), .value = ) adjusts the calling thread's stripe so the total comes out right; it
+        isn't atomic against increments happening at the same time.
+    """
+    __slots__ = ('_local', '_stripes', '_stripes_lock', '_cache_ttl', '_cached', '_cached_at')
+
+    def __init__(self, value=0, cache_ttl=None):
+        self._local = threading.local()
+        self._stripes = []
+        self._stripes_lock = threading.Lock()
+        self._cache_ttl = cache_ttl
+        self._cached_at = None
+        self.stripe()._value = value
+
+    def stripe(self):
+        # this thread's stripe, made on first use
+        try:
+            return self._local.stripe
+        except AttributeError:
+            stripe = self._local.stripe = MutableInteger(0)
+            with self._stripes_lock:
+                # copy on write, so sums can iterate without the lock
+                self._stripes = self._stripes + [stripe]
+            return stripe
+
+    def total(self):
+        return sum(stripe._value for stripe in self._stripes)
+
+    @property
+    def _value(self):
+        if self._cache_ttl is None:
+            return self.total()
+        now = time.monotonic()
+        if self._cached_at is None or now - self._cached_at >= self._cache_ttl:
+            self._cached = self.total()
+            self._cached_at = now
+        return self._cached
+
+    @_value.setter
+    def _value(self, value):
+        self.stripe()._value += value - self.total()
+        self._cached_at = None
+
+    def __iadd__(self, value):
+        if isinstance(value, int):
+            self.stripe()._value += value
+            return self
+        raise ValueError("Can only add integers to MutableInteger")
+
+    def __isub__(self, value):
+        if isinstance(value, int):
+            self.stripe()._value -= value
+            return self
+        raise ValueError("Can only subtract integers to MutableInteger")
+
+
+class MutableIntegerView(MutableInteger):
+    # one slot of a MutableIntegerArray; `_value` reads and writes the array, so every MutableInteger method works
+    __slots__ = ('_data', '_index')
+
+    def __init__(self, data, index):
+        self._data = data
+        self._index = index
+
+    @property
+    def _value(self):
+        return int(self._data[self._index])
+
+    @_value.setter
+    def _value(self, value):
+        self._data[self._index] = value
+
+
+class MutableIntegerArray:
+    """
+    many counters packed into one array('q') (or int64 numpy array with use_numpy=True): 8 bytes per counter
+        instead of an object each. indexing hands out MutableIntegerView objects that act as MutableIntegers:
+        ```
+        counters = MutableIntegerArray(1000)
+        hits = counters[5]
+        hits += 1               # writes counters.data[5]
+        counters.add(6, 2)      # or skip the view
+        counters.sum(), counters.max()
+        counters.reset()
+        ```
+    """
+
+    def __init__(self, size_or_values=0, use_numpy=False):
+        if isinstance(size_or_values, int):
+            if use_numpy:
+                self.data = np.zeros(size_or_values, dtype=np.int64)
+            else:
+                self.data = array('q', bytes(8 * size_or_values))
+        elif use_numpy:
+            self.data = np.array(size_or_values, dtype=np.int64)
+        else:
+            self.data = array('q', size_or_values)
+
+    def is_numpy(self):
+        return np is not None and isinstance(self.data, np.ndarray)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.data)
+        if not 0 <= index < len(self.data):
+            raise IndexError("MutableIntegerArray index out of range")
+        return MutableIntegerView(self.data, index)
+
+    def __iter__(self):
+        for index in range(len(self.data)):
+            yield MutableIntegerView(self.data, index)
+
+    def __setitem__(self, index, value):
+        if index < 0:
+            index += len(self)
+        # `counters[i] += 1` already updated the view in place and assigns it back here; writing it again could
+        # overwrite an update made in between
+        if isinstance(value, MutableIntegerView) and value._data is self.data and value._index == index:
+            return
+        self.data[index] = int(value)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.tolist()!r})"
+
+    def get(self, index):
+        return int(self.data[index])
+
+    def set(self, index, value):
+        self.data[index] = value
+
+    def add(self, index, value=1):
+        self.data[index] += value
+
+    def tolist(self):
+        return [int(v) for v in self.data]
+
+    # Bulk operations:
+
+    def reset(self, value=0):
+        if self.is_numpy():
+            self.data.fill(value)
+        else:
+            self.data[:] = array('q', [value]) * len(self.data)
+
+    def sum(self):
+        if self.is_numpy():
+            return int(self.data.sum())
+        return sum(self.data)
+
+    def max(self):
+        if self.is_numpy():
+            return int(self.data.max())
+        return max(self.data)
+
+    def min(self):
+        if self.is_numpy():
+            return int(self.data.min())
+        return min(self.data)
+
+
+class SharedMutableIntegerView(MutableIntegerView):
+    # view whose += and -= hold the slot's lock, so they are atomic across processes
+    __slots__ = ('_lock',)
+
+    def __init__(self, data, index, lock):
+        super().__init__(data, index)
+        self._lock = lock
+
+    def __iadd__(self, value):
+        if isinstance(value, int):
+            with self._lock:
+                self._data[self._index] += value
+            return self
+        raise ValueError("Can only add integers to MutableInteger")
+
+    def __isub__(self, value):
+        if isinstance(value, int):
+            with self._lock:
+                self._data[self._index] -= value
+            return self
+        raise ValueError("Can only subtract integers to MutableInteger")
+
+
+class SharedMutableIntegerArray(MutableIntegerArray):
+    """
+    MutableIntegerArray in a multiprocessing.shared_memory segment, so worker processes can all update the same
+        counters directly (no manager process, no message per increment).
+    updates through add() or a view's +=/-= are atomic: they hold one of `stripes` locks, picked by index, so
+        processes only wait on each other when they hit counters that share a stripe. reads, set() and the bulk
+        operations don't lock.
+
+    pass it to workers as a Process argument or a Pool initializer argument (the locks can only travel that
+        way, like any multiprocessing lock). every process should close() when done with it, and the creating
+        process unlink()s it afterwards; using it as a context manager does both:
+        ```
+        with SharedMutableIntegerArray(100) as counters:
+            workers = [Process(target=work, args=(counters,)) for _ in range(8)]
+            ...
+        ```
+    """
+
+    def __init__(self, size_or_values=0, stripes=16, context=None):
+        values = None
+        if not isinstance(size_or_values, int):
+            values = array('q', size_or_values)
+            size_or_values = len(values)
+
+        # zero-size segments aren't allowed
+        self.shm = shared_memory.SharedMemory(create=True, size=max(8 * size_or_values, 8))
+        self.owner = True
+        self.length = size_or_values
+        self.data = self.map()
+        if values is not None:
+            self.data[:] = values
+
+        context = context or multiprocessing
+        self.locks = [context.Lock() for _ in range(stripes)]
+
+    def map(self):
+        # the segment can be rounded up to a page, so only map the counters
+        return self.shm.buf[:8 * self.length].cast('q')
+
+    def lock_for(self, index):
+        return self.locks[index % len(self.locks)]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("MutableIntegerArray index out of range")
+        return SharedMutableIntegerView(self.data, index, self.lock_for(index))
+
+    def __iter__(self):
+        for index in range(self.length):
+            yield SharedMutableIntegerView(self.data, index, self.lock_for(index))
+
+    def add(self, index, value=1):
+        with self.lock_for(index):
+            self.data[index] += value
+
+    def __getstate__(self):
+        # attach by name in the other process
+        return {'name': self.shm.name, 'length': self.length, 'locks': self.locks}
+
+    def __setstate__(self, state):
+        self.shm = shared_memory.SharedMemory(name=state['name'])
+        self.owner = False
+        self.length = state['length']
+        self.locks = state['locks']
+        self.data = self.map()
+
+    def close(self):
+        # views handed out before this stop working
+        self.data.release()
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        if self.owner:
+            self.unlink()
@@ -0,0 +1,181 @@
+from array import array
+import inspect
+from easytools.decorator_bases import StaticOrInstanceDecorator
+from easytools.flexmethod import ArgumentParsingDecorator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class RowView:
+    """
+    Zero-copy view of one row of a RecordTable. Column values are read from and written to the
+        table's columns; nothing is copied into the view. Row types made by RecordTable also inherit
+        from the record class, so rows can be passed as nself to flexmethods and call its methods.
+    """
+    __slots__ = ('_columns', '_index')
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={column[self._index]!r}" for name, column in self._columns.items())
+        return f"{type(self).__name__}({values})"
+
+
+def column_property(name):
+    def fget(row):
+        return row._columns[name][row._index]
+
+    def fset(row, value):
+        row._columns[name][row._index] = value
+
+    return property(fget, fset)
+
+
+class RecordTable:
+    """
+    Struct-of-arrays container for many records of a (flexmethod-bearing) class
+
+    Each attribute is stored once as a column (array.array, numpy array or list) instead of in a
+        __dict__ per object. Rows are lightweight views that act as instances of the record class:
+
+        ```
+        table = RecordTable(MyClass, {'arg1': [1, 2, 3], 'arg2': [4, 5, 6]})
+        MyClass.foo(table[0], 3)        # rows can be passed as the nself namespace
+        table[0].foo(3)                 # or used as instances
+        table.call('foo', 3)            # or run the method over every row
+        ```
+    """
+
+    def __init__(self, cls, columns, typecodes=None):
+        self.cls = cls
+        self.columns = {}
+        typecodes = typecodes or {}
+
+        for name, column in columns.items():
+            self.columns[name] = self.as_column(column, typecodes.get(name))
+
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length, got lengths {sorted(lengths)}")
+        self.length = lengths.pop() if lengths else 0
+
+        self.row_type = self.make_row_type(cls, list(self.columns.keys()))
+
+    @classmethod
+    def from_instances(cls, record_cls, instances, names=None, typecodes=None):
+        # build a table from existing objects; names default to the attributes of the first instance
+        instances = list(instances)
+        if names is None:
+            names = list(vars(instances[0]).keys()) if instances else []
+        columns = {name: [getattr(instance, name) for instance in instances] for name in names}
+        return cls(record_cls, columns, typecodes=typecodes)
+
+    @staticmethod
+    def as_column(column, typecode=None):
+        # arrays are used as is (zero-copy); other sequences are packed into an array when possible
+        if isinstance(column, array) or (np is not None and isinstance(column, np.ndarray)):
+            return column
+
+        column = list(column)
+        if typecode is None:
+            if all(type(v) is int for v in column):
+                typecode = 'q'
+            elif all(type(v) in (int, float) for v in column):
+                typecode = 'd'
+            else:
+                return column
+        return array(typecode, column)
+
+    @staticmethod
+    def make_row_type(cls, names):
+        namespace = {'__slots__': ()}
+        for name in names:
+            namespace[name] = column_property(name)
+
+        try:
+            return type(f"{cls.__name__}Row", (RowView, cls), namespace)
+        except TypeError:
+            # record class has an incompatible layout (eg __slots__); rows keep the columns but not the methods
+            namespace['__slots__'] = ('__dict__',)
+            return type(f"{cls.__name__}Row", (RowView,), namespace)
+
+    def row(self, index):
+        row = self.row_type.__new__(self.row_type)
+        row._columns = self.columns
+        row._index = index
+        return row
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("RecordTable index out of range")
+        return self.row(index)
+
+    def __iter__(self):
+        for index in range(self.length):
+            yield self.row(index)
+
+    def column(self, name):
+        return self.columns[name]
+
+    def append(self, **values):
+        if set(values) != set(self.columns):
+            raise ValueError(f"append() needs a value for every column: {', '.join(self.columns)}")
+        # check every value before touching any column, so a value that doesn't fit its column
+        # (eg a float for an 'q' array) leaves the table as it was
+        grown = {}
+        for name, column in self.columns.items():
+            if np is not None and isinstance(column, np.ndarray):
+                grown[name] = np.append(column, values[name])
+            elif isinstance(column, array):
+                array(column.typecode, [values[name]])
+
+        for name, column in self.columns.items():
+            if name in grown:
+                self.columns[name] = grown[name]
+            else:
+                column.append(values[name])
+        self.length += 1
+
+    def table_function(self, name):
+        # underlying function of a method of the record class, skipping any per-call argument parsing.
+        # only for plain functions and bare argument-parsing decorators; anything else (stacked layers,
+        # overloads, untyped, ...) does real work per call, so None is returned and rows go through the descriptor
+        attr = inspect.getattr_static(self.cls, name)
+        layer = StaticOrInstanceDecorator.as_layer(attr)
+        if layer is not None:
+            if isinstance(layer, ArgumentParsingDecorator) and layer.inner is None:
+                return layer.func
+            return None
+        if inspect.isfunction(attr):
+            return attr
+        return None
+
+    def call(self, name, *args, **kwargs):
+        """
+        call method name over every row, same as calling it on each row (`[row.name(*args, **kwargs) for row in table]`).
+            for plain methods and flexmethods, one row view is moved along the table and the function is called
+            directly instead of creating a row and a bound method per row, so the method should not keep a
+            reference to self/nself.
+        """
+        func = self.table_function(name)
+
+        results = []
+        if func is None:
+            for index in range(self.length):
+                row = self.row(index)
+                results.append(getattr(row, name)(*args, **kwargs))
+            return results
+
+        row = self.row(0)
+        # as in an instance call of a flexmethod
+        row.__dict__['__static_from_flexmethod__'] = False
+        for index in range(self.length):
+            row._index = index
+            results.append(func(row, *args, **kwargs))
+        return results
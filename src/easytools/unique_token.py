@@ -5,7 +5,8 @@ import random
 
 
 class UniqueTokenHandler:
-    def __init__(self, complexity=5):
+    # seed = seed for a private random.Random, for reproducible tokens; None seeds from the system
+    def __init__(self, complexity=5, seed=None):
         self.combining_chars = [
             '\u0300', '\u0301', '\u0302', '\u0303', '\u0304', '\u0305', '\u0306', '\u0307',
             '\u0308', '\u0309', '\u030A', '\u030B', '\u030C', '\u030D', '\u030E', '\u030F',
@@ -24,11 +25,18 @@ class UniqueTokenHandler:
             '\u20D0', '\u20D1', '\u20D2', '\u20D3', '\u20D4', '\u20D5', '\u20D6', '\u20D7',
             '\u20D8', '\u20D9', '\u20DA', '\u20DB', '\u20DC', '\u20E1'
         ]
+        # two-way index: token -> id and id -> token. ids only ever go up, so a deleted token's id is never reused
         self.generated = {}
+        self.tokens = {}
+        self._next_id = 0
         self.complexity = complexity
+        self.random = random.Random(seed)
+
+    # give up on finding a free token after this many collisions in a row
+    max_attempts = 100
 
     def glitch_char(self, base_char, num_combining=5):
-        glitchy_str = base_char + ''.join(random.choice(self.combining_chars) for _ in range(num_combining))
+        glitchy_str = base_char + ''.join(self.random.choices(self.combining_chars, k=num_combining))
         return glitchy_str
 
     def generate(self, complexity = None):
@@ -36,14 +44,41 @@ class UniqueTokenHandler:
             c = complexity
         else:
             c = self.complexity
-        g = self.glitch_char("$", num_combining=c)
-        self.generated[g] = len(self.generated)
-        return g
+        for _ in range(self.max_attempts):
+            g = self.glitch_char("$", num_combining=c)
+            # a token already handed out would otherwise overwrite its id
+            if g not in self.generated:
+                self.add(g)
+                return g
+        raise ValueError(f"Couldn't find an unused token with complexity {c}; use a higher complexity")
+
+    def generate_many(self, n, complexity=None):
+        # n tokens from a single random.choices call; the rare collisions are redrawn one at a time
+        c = complexity or self.complexity
+        chars = ''.join(self.random.choices(self.combining_chars, k=n * c))
+        tokens = []
+        for i in range(0, n * c, c):
+            g = "$" + chars[i:i + c]
+            if g in self.generated:
+                g = self.generate(c)
+            else:
+                self.add(g)
+            tokens.append(g)
+        return tokens
+
+    def add(self, token):
+        token_id = self._next_id
+        self._next_id += 1
+        self.generated[token] = token_id
+        self.tokens[token_id] = token
+        return token_id
 
     def delete(self, c):
         if isinstance(c, int):
-            c = self.get_token_from_id(c)
-        del self.generated[c]
+            token = self.tokens.pop(c)
+            del self.generated[token]
+        else:
+            del self.tokens[self.generated.pop(c)]
 
     def get(self, c):
         if isinstance(c, str):
@@ -57,7 +92,7 @@ class UniqueTokenHandler:
         return self.generated[c]
 
     def get_token_from_id(self, c):
-        return list(self.generated.keys())[list(self.generated.values()).index(c)]
+        return self.tokens[c]
 
 if __name__ == "__main__":
 
@@ -1,6 +1,7 @@
 import pytest
+import inspect
 import easytools
-from easytools.adaptive_method import untyped, MyClass 
+from easytools.adaptive_method import untyped
 
 
 class MyClass:
@@ -36,5 +37,112 @@ def test_functions():
     assert c.foo3() == 13
     assert MyClass.foo3(2) == 26
 
+def test_invalid_parameter_map_fails_at_decoration():
+    with pytest.raises(AttributeError):
+        class BadMap:
+            @untyped({"missing": "attribute1"})
+            def foo(self, arg1):
+                return arg1
+
+    with pytest.raises(AttributeError):
+        class BadList:
+            @untyped(["missing"])
+            def foo(self, arg1):
+                return arg1
+
+class Partial:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+    @untyped()
+    def foo(self, arg1, arg2=10):
+        return arg1 + arg2
+
+    @untyped(["arg2"], inverse=True)
+    def bar(self, arg1, arg2=10):
+        return arg1 + arg2
+
+    @untyped({"arg1": "attribute1"})
+    def baz(self, arg1):
+        return arg1
+
+def test_attribute_plan_per_instance():
+    # the first instance of a type sets up the plan; later instances with other attributes still work
+    assert Partial(arg1=1).foo() == 11
+    assert Partial(arg1=1, arg2=2).foo() == 3
+    assert Partial(arg2=2).foo(5) == 7
+    assert Partial(arg1=1).foo() == 11
+
+def test_missing_attributes():
+    assert Partial(arg1=1).bar() == 11
+    with pytest.raises(TypeError):
+        Partial().bar()
+    assert Partial(attribute1=4).baz() == 4
+    with pytest.raises(AttributeError):
+        Partial().baz()
+
+class Subclass(Partial):
+    arg2 = 100
+
+def test_attribute_plan_per_type():
+    assert Partial(arg1=1).foo() == 11
+    assert Subclass(arg1=1).foo() == 101
+
+class Vector:
+    def __init__(self, x, y, label='v'):
+        self.x = x
+        self.y = y
+        self.label = label
+
+    @untyped({"arg1": "x", "arg2": "y"})
+    def add(self, arg1, arg2, scale=1):
+        return (arg1 + arg2) * scale
+
+    @untyped({"arg1": "label"})
+    def shout(self, arg1):
+        return arg1.upper()
+
+def test_over_matches_per_instance_calls():
+    vectors = [Vector(i, 2 * i) for i in range(5)]
+    assert list(Vector.add.over(vectors)) == [v.add() for v in vectors]
+    assert list(Vector.add.over(vectors, scale=2)) == [v.add(scale=2) for v in vectors]
+    assert Vector.add.over(vectors, vectorize=False) == [0, 3, 6, 9, 12]
+
+def test_over_falls_back_for_non_numeric_attributes():
+    vectors = [Vector(0, 0, 'a'), Vector(0, 0, 'b')]
+    assert Vector.shout.over(vectors) == ['A', 'B']
+
+def test_over_vectorizes_with_numpy():
+    np = pytest.importorskip('numpy')
+    vectors = [Vector(i, 2 * i) for i in range(5)]
+    result = Vector.add.over(vectors)
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [0, 3, 6, 9, 12]
+
+def test_over_falls_back_when_function_rejects_arrays():
+    pytest.importorskip('numpy')
+
+    class Clamp(Vector):
+        @untyped({"arg1": "x"})
+        def positive(self, arg1):
+            return arg1 if arg1 > 0 else 0
+
+    vectors = [Clamp(i - 1, 0) for i in range(3)]
+    assert Clamp.positive.over(vectors) == [0, 0, 1]
+
+def test_over_raises_other_errors_once():
+    pytest.importorskip('numpy')
+    calls = []
+
+    class Broken(Vector):
+        @untyped({"arg1": "x"})
+        def lookup(self, arg1):
+            calls.append(arg1)
+            return {}['missing']
+
+    with pytest.raises(KeyError):
+        Broken.lookup.over([Broken(1, 2), Broken(3, 4)])
+    assert len(calls) == 1
+
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
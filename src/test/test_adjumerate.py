@@ -0,0 +1,473 @@
+from collections import deque
+from collections.abc import Sequence
+from types import MappingProxyType
+import json
+import os
+import pytest
+from easytools.adjumerate import adjumerate
+
+
+def test_counts_like_enumerate():
+    assert [(int(i), x) for i, x in adjumerate('abc')] == list(enumerate('abc'))
+    assert [int(i) for i, x in adjumerate('abc', start=5)] == [5, 6, 7]
+
+def test_adjusted_count_and_raw():
+    out = []
+    for i, x in adjumerate(range(10), start=0):
+        if not i % 7:
+            i.set(0)
+        if i == 4:
+            i += 1
+        out.append((int(i), i.raw))
+    assert out == [(0, 0), (1, 1), (2, 2), (3, 3), (5, 4), (6, 5), (0, 6), (1, 7), (2, 8), (3, 9)]
+
+def test_counter_count_property():
+    counter = iter(adjumerate('abcd'))
+    next(counter)
+    counter.count = 10
+    i, x = next(counter)
+    assert (i, x, i.raw) == (11, 'b', 1)
+
+def test_raw_is_read_only():
+    for i, x in adjumerate('a'):
+        with pytest.raises(AttributeError):
+            i.raw = 5
+
+def test_one_python_call_per_item():
+    # the timing against enumerate lives in benchmarks/bench_adjumerate.py; here only check that counting
+    # doesn't add python-level calls on top of Counter.__next__
+    import sys
+    calls = []
+
+    def profile(frame, event, arg):
+        if event == 'call':
+            calls.append(frame.f_code.co_name)
+
+    counter = iter(adjumerate(list(range(1000))))
+    sys.setprofile(profile)
+    try:
+        for i, x in counter:
+            pass
+    finally:
+        sys.setprofile(None)
+    assert calls.count('__next__') == 1001
+    assert len(calls) <= 1002
+
+
+def test_seekable_sequence_jumps_and_rewinds():
+    out = []
+    for i, x in adjumerate(list('abcdefgh'), seekable=True):
+        out.append(x)
+        if x == 'c' and i.raw == 2:
+            i.set(0)
+        if x == 'e':
+            i += 1
+    assert out == ['a', 'b', 'c', 'b', 'c', 'd', 'e', 'g', 'h']
+
+def test_seekable_sequence_is_indexed_not_copied():
+    class Indexed(Sequence):
+        def __init__(self):
+            self.reads = []
+        def __len__(self):
+            return 1000
+        def __getitem__(self, i):
+            if i >= 1000:
+                raise IndexError
+            self.reads.append(i)
+            return i
+
+    data = Indexed()
+    counter = iter(adjumerate(data, seekable=True, start=1))
+    next(counter)
+    counter.seek(500)
+    i, x = next(counter)
+    assert (int(i), x, i.raw) == (501, 500, 1)
+    assert data.reads == [0, 500]
+
+def test_seekable_memoryview():
+    counter = iter(adjumerate(memoryview(b'hello'), seekable=True))
+    counter.seek(4)
+    assert next(counter)[1] == ord('o')
+    with pytest.raises(StopIteration):
+        next(counter)
+
+def test_seekable_iterator_skips_and_rewinds_within_buffer():
+    out = []
+    for i, x in adjumerate(iter('abcdefgh'), seekable=True, buffer=3):
+        out.append((int(i), x))
+        if x == 'c' and i.raw == 2:
+            i.set(0)
+        if x == 'd':
+            i += 2
+    assert out == [(0, 'a'), (1, 'b'), (2, 'c'), (1, 'b'), (2, 'c'), (3, 'd'), (6, 'g'), (7, 'h')]
+
+def test_seekable_iterator_rewind_past_buffer():
+    counter = iter(adjumerate(iter(range(10)), seekable=True, buffer=2))
+    for _ in range(5):
+        next(counter)
+    counter.seek(1)
+    with pytest.raises(IndexError):
+        next(counter)
+
+def test_seek_before_start():
+    counter = iter(adjumerate('abc', seekable=True, start=5))
+    counter.count = 2
+    with pytest.raises(IndexError):
+        next(counter)
+
+def test_chunked_sequence():
+    out = list(adjumerate(list(range(10)), chunk=4, start=1))
+    assert out == [(range(1, 5), [0, 1, 2, 3]), (range(5, 9), [4, 5, 6, 7]), (range(9, 11), [8, 9])]
+
+def test_chunked_iterator_repeat_skip_resize():
+    chunks = iter(adjumerate(iter(range(20)), chunk=4))
+    out = []
+    for indices, chunk in chunks:
+        out.append((indices.start, list(chunk)))
+        if indices.start == 4 and chunks._count.raw == 1:
+            chunks.repeat()
+        if indices.start == 8:
+            chunks.skip()
+            chunks.resize(3)
+    assert out == [(0, [0, 1, 2, 3]), (4, [4, 5, 6, 7]), (4, [4, 5, 6, 7]), (8, [8, 9, 10, 11]),
+                   (15, [15, 16, 17]), (18, [18, 19])]
+    assert chunks.count == 5
+
+def test_chunked_reuse_buffer():
+    chunks = [chunk for _, chunk in adjumerate(iter('abcde'), chunk=2, reuse_buffer=True)]
+    assert chunks[0] is chunks[1] is chunks[2]
+
+def test_chunked_rejects_seekable():
+    with pytest.raises(ValueError):
+        adjumerate('abc', chunk=2, seekable=True)
+
+def test_blocks_are_views():
+    np = pytest.importorskip('numpy')
+    data = np.arange(10) * 10
+    out = []
+    for indices, view in adjumerate(data, block=4, start=1):
+        out.append((indices.tolist(), view.tolist()))
+        view[:] = 0
+    assert out == [([1, 2, 3, 4], [0, 10, 20, 30]), ([5, 6, 7, 8], [40, 50, 60, 70]), ([9, 10], [80, 90])]
+    assert not data.any()
+
+def test_blocks_counter_moves_window():
+    np = pytest.importorskip('numpy')
+    blocks = iter(adjumerate(np.arange(20).reshape(10, 2), block=3))
+    indices, view = next(blocks)
+    assert view.shape == (3, 2)
+    blocks.count += 1  # skip block 1
+    indices, view = next(blocks)
+    assert indices.tolist() == [6, 7, 8]
+    blocks.seek(0)
+    assert next(blocks)[0].tolist() == [0, 1, 2]
+
+def test_blocks_over_buffer():
+    np = pytest.importorskip('numpy')
+    from array import array
+    data = array('d', [0.5] * 5)
+    blocks = [view for _, view in adjumerate(data, block=2)]
+    assert [len(b) for b in blocks] == [2, 2, 1]
+    blocks[0][0] = 1.5
+    assert data[0] == 1.5
+
+def test_async_adjumerate():
+    import asyncio
+
+    async def stream():
+        for x in 'abcde':
+            await asyncio.sleep(0)
+            yield x
+
+    async def consume():
+        out = []
+        async for i, x in adjumerate(stream(), start=1):
+            out.append((int(i), i.raw, x))
+            if x == 'b':
+                i.set(10)
+        return out
+
+    assert asyncio.run(consume()) == [(1, 0, 'a'), (2, 1, 'b'), (11, 2, 'c'), (12, 3, 'd'), (13, 4, 'e')]
+
+def test_async_rejects_modes():
+    with pytest.raises(ValueError):
+        adjumerate([], chunk=2).__aiter__()
+
+def test_parallel_ordered():
+    import time
+
+    def work(x):
+        time.sleep(0.01 * (x % 3))
+        return x * x
+
+    out = [(int(i), i.raw, r) for i, r in adjumerate.parallel(work, range(10), window=4, start=1)]
+    assert out == [(n + 1, n, n * n) for n in range(10)]
+
+def test_parallel_unordered_keeps_counts():
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(2) as pool:
+        out = {int(i): r for i, r in adjumerate.parallel(str, 'abcdef', executor=pool, ordered=False)}
+    assert out == dict(enumerate('abcdef'))
+
+def test_parallel_bounded_window():
+    import threading
+    started = []
+    gate = threading.Event()
+
+    def work(x):
+        started.append(x)
+        gate.wait(1)
+        return x
+
+    results = adjumerate.parallel(work, range(100), window=3)
+    gate.set()
+    next(results)
+    assert len(started) <= 4
+    results.close()
+
+def test_parallel_forwards_exceptions():
+    def work(x):
+        if x == 2:
+            raise KeyError(x)
+        return x
+
+    with pytest.raises(KeyError):
+        list(adjumerate.parallel(work, range(5)))
+
+def test_lines_seek_and_rewind(tmp_path):
+    path = tmp_path / 'log.txt'
+    path.write_bytes(b'zero\none\ntwo\nthree')
+    out = []
+    with adjumerate.lines(path) as lines:
+        for i, line in lines:
+            out.append(line)
+            if line == b'two\n' and i.raw == 2:
+                i -= 2  # read the context again
+        assert len(lines._sequence) == 4
+    assert out == [b'zero\n', b'one\n', b'two\n', b'one\n', b'two\n', b'three']
+
+def test_lines_index_saved_and_reused(tmp_path):
+    path = tmp_path / 'log.txt'
+    index = tmp_path / 'log.idx'
+    path.write_bytes(b'a\nb\nc\n')
+    with adjumerate.lines(path, index_path=index) as lines:
+        assert [x for _, x in lines] == [b'a\n', b'b\n', b'c\n']
+    assert index.exists()
+
+    with adjumerate.lines(path, index_path=index) as lines:
+        lines.seek(2)
+        assert next(lines)[1] == b'c\n'
+
+    # a changed file invalidates the saved index
+    path.write_bytes(b'a much longer first line\nb\n')
+    with adjumerate.lines(path, index_path=index) as lines:
+        assert [x for _, x in lines] == [b'a much longer first line\n', b'b\n']
+
+def test_lines_empty_file(tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.write_bytes(b'')
+    with adjumerate.lines(path) as lines:
+        assert list(lines) == []
+
+def test_prefetch_counts_and_adjusts():
+    out = []
+    for i, x in adjumerate(iter(range(6)), prefetch=2, start=1):
+        out.append((int(i), i.raw, x))
+        if x == 1:
+            i += 10
+    assert out == [(1, 0, 0), (2, 1, 1), (13, 2, 2), (14, 3, 3), (15, 4, 4), (16, 5, 5)]
+
+def test_prefetch_reads_ahead_while_loop_body_runs():
+    import threading
+    read_ahead = threading.Event()
+
+    def source():
+        yield 0
+        yield 1
+        read_ahead.set()
+        yield 2
+
+    counter = iter(adjumerate(source(), prefetch=5))
+    next(counter)
+    # the loop body still holds item 0 while the source is read further
+    assert read_ahead.wait(10)
+    assert [x for i, x in counter] == [1, 2]
+
+def test_prefetch_forwards_source_errors():
+    def broken():
+        yield 1
+        raise OSError("disk gone")
+
+    counter = iter(adjumerate(broken(), prefetch=4))
+    assert next(counter)[1] == 1
+    with pytest.raises(OSError, match="disk gone"):
+        next(counter)
+    with pytest.raises(StopIteration):
+        next(counter)
+
+def test_prefetch_with_seekable_iterator():
+    out = []
+    for i, x in adjumerate(iter('abcdef'), prefetch=2, seekable=True, buffer=2):
+        out.append(x)
+        if x == 'b' and i.raw == 1:
+            i += 2
+    assert out == ['a', 'b', 'e', 'f']
+
+def test_checkpoint_resume_iterator(tmp_path):
+    path = tmp_path / 'progress.json'
+    done = []
+    with pytest.raises(RuntimeError):
+        for i, x in adjumerate(iter(range(10)), checkpoint=path, checkpoint_every=3, resume_from=path):
+            if x == 7:
+                raise RuntimeError("deploy")
+            done.append(x)
+    # checkpoints after items 0-2 and 0-5; item 6 is redone
+    assert json.loads(path.read_text()) == {'count': 5, 'raw': 5}
+    assert not (tmp_path / 'progress.json.tmp').exists()
+
+    rest = [(int(i), i.raw, x) for i, x in
+            adjumerate(iter(range(10)), checkpoint=path, checkpoint_every=3, resume_from=path)]
+    assert rest == [(6, 6, 6), (7, 7, 7), (8, 8, 8), (9, 9, 9)]
+    assert list(adjumerate(iter(range(10)), resume_from=path)) == []
+
+def test_checkpoint_keeps_adjusted_count_and_seeks(tmp_path):
+    class Indexed(Sequence):
+        def __init__(self):
+            self.reads = []
+        def __len__(self):
+            return 100
+        def __getitem__(self, i):
+            self.reads.append(i)
+            return i
+
+    path = tmp_path / 'progress.json'
+    for i, x in adjumerate(Indexed(), seekable=True, checkpoint=path, checkpoint_every=1):
+        if x == 2:
+            i += 40
+        if x == 50:
+            break
+
+    data = Indexed()
+    i, x = next(iter(adjumerate(data, seekable=True, resume_from=path)))
+    assert (int(i), i.raw, x) == (50, 10, 50)
+    assert data.reads == [50]
+
+def test_checkpoint_interval(tmp_path, monkeypatch):
+    import easytools.adjumerate
+    clock = [1000.0]
+    monkeypatch.setattr(easytools.adjumerate.time, 'monotonic', lambda: clock[0])
+
+    path = tmp_path / 'progress.json'
+    counter = iter(adjumerate(range(100), checkpoint=path, checkpoint_every=None, checkpoint_interval=60))
+    next(counter)
+    next(counter)
+    clock[0] += 59
+    next(counter)
+    assert not path.exists()
+    clock[0] += 1
+    next(counter)
+    assert json.loads(path.read_text())['raw'] == 2
+
+def test_checkpoint_lines(tmp_path):
+    log = tmp_path / 'log.txt'
+    log.write_bytes(b'a\nb\nc\nd\n')
+    path = tmp_path / 'progress.json'
+    with adjumerate.lines(log, checkpoint=path, checkpoint_every=1) as lines:
+        next(lines)
+        next(lines)
+        next(lines)
+    with adjumerate.lines(log, resume_from=path) as lines:
+        assert [x for _, x in lines] == [b'c\n', b'd\n']
+
+def test_stats_polling():
+    import time
+    counter = iter(adjumerate(range(40), stats=4))
+    for i, x in counter:
+        time.sleep(0.001)
+        if x == 19:
+            stats = counter.stats()
+            timed = len(counter._stats_latencies)
+    assert stats['items'] == 20
+    assert stats['rate'] > 0
+    assert stats['eta'] == pytest.approx(20 / stats['rate'])
+    # items 0, 4, 8, 12 and 16 were timed
+    assert stats['latency'][50] >= 0.001
+    assert timed == 5
+
+def test_stats_callback_and_unknown_length():
+    reports = []
+    for i, x in adjumerate(iter(range(50)), stats=1, stats_callback=reports.append, stats_interval=0):
+        pass
+    assert len(reports) == 50
+    assert reports[-1]['items'] == 50
+    assert reports[-1]['eta'] is None
+
+def test_stats_with_checkpoint(tmp_path):
+    path = tmp_path / 'progress.json'
+    counter = iter(adjumerate(list(range(10)), seekable=True, stats=True, checkpoint=path, checkpoint_every=2))
+    for i, x in counter:
+        pass
+    assert counter.stats()['items'] == 10
+    assert json.loads(path.read_text()) == {'count': 9, 'raw': 9}
+
+def test_stats_chunks():
+    counter = iter(adjumerate(list(range(10)), chunk=3, stats=True))
+    next(counter)
+    assert counter.stats()['items'] == 1
+    assert counter._stats_total == 4
+
+def test_resume_without_checkpoint_path_never_saves(tmp_path, monkeypatch):
+    import time
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / 'progress.json'
+    path.write_text(json.dumps({'count': 1, 'raw': 1}))
+    out = []
+    for i, x in adjumerate(iter(range(5)), resume_from=path, checkpoint_interval=0.001):
+        time.sleep(0.002)
+        out.append(x)
+    assert out == [2, 3, 4]
+    assert os.listdir(tmp_path) == ['progress.json']
+
+def test_resume_jumps_into_sequences(tmp_path):
+    class Indexed(Sequence):
+        def __init__(self):
+            self.reads = []
+        def __len__(self):
+            return 1000
+        def __getitem__(self, i):
+            if i >= 1000:
+                raise IndexError(i)
+            self.reads.append(i)
+            return i
+
+    path = tmp_path / 'progress.json'
+    path.write_text(json.dumps({'count': 898, 'raw': 898}))
+    data = Indexed()
+    rest = [x for _, x in adjumerate(data, resume_from=path)]
+    assert rest == list(range(899, 1000))
+    assert data.reads == rest
+
+    assert [x for _, x in adjumerate(list(range(1000)), resume_from=path)] == rest
+
+def test_async_rejects_checkpoints(tmp_path):
+    with pytest.raises(ValueError):
+        adjumerate([], checkpoint=tmp_path / 'progress.json').__aiter__()
+    with pytest.raises(ValueError):
+        adjumerate([], resume_from=tmp_path / 'progress.json').__aiter__()
+
+def test_async_rejects_prefetch():
+    with pytest.raises(ValueError):
+        adjumerate([], prefetch=4).__aiter__()
+
+def test_async_rejects_stats():
+    with pytest.raises(ValueError):
+        adjumerate([], stats=True).__aiter__()
+
+def test_chunked_deque_falls_back_to_iterating():
+    assert list(adjumerate(deque(range(5)), chunk=2)) == [(range(0, 2), [0, 1]), (range(2, 4), [2, 3]),
+                                                          (range(4, 5), [4])]
+
+def test_mappings_are_not_indexed():
+    proxy = MappingProxyType({'a': 1, 'b': 2})
+    assert [x for _, x in adjumerate(proxy, seekable=True, buffer=2)] == ['a', 'b']
+    assert list(adjumerate(proxy, chunk=2)) == [(range(0, 2), ['a', 'b'])]
@@ -0,0 +1,55 @@
+import inspect
+import pytest
+from easytools.arg_binding import SignatureLayout
+from easytools.adaptive_method import arg_formatter
+
+
+def foo(self, arg1, arg2, arg3=3):
+    pass
+
+def foo_var(self, arg1, *args, **kwargs):
+    pass
+
+layout = SignatureLayout(inspect.signature(foo))
+
+
+def test_all_positional():
+    assert layout.bind((1, 2), {}) == ([1, 2, 3], {})
+    assert layout.bind((1, 2, 4), {}) == ([1, 2, 4], {})
+    assert layout.bind((1,), {}) == (None, 1)
+
+def test_all_keyword():
+    assert layout.bind((), {'arg2': 2, 'arg1': 1}) == ([1, 2, 3], {})
+    assert layout.bind((), {'arg1': 1, 'other': 5}) == (None, 1)
+
+def test_keywords_take_slots_before_positionals():
+    assert layout.bind((5,), {'arg1': 1}) == ([1, 5, 3], {})
+    assert layout.bind((5, 6), {'arg2': 2}) == ([5, 2, 6], {})
+
+def test_preseeded_values_are_overridden_by_arguments():
+    assert layout.bind((), {}, {'arg1': 1, 'arg2': 2}) == ([1, 2, 3], {})
+    assert layout.bind((7,), {}, {'arg1': 1, 'arg2': 2}) == ([7, 2, 3], {})
+    assert layout.bind((7,), {'arg2': 8}, {'arg1': 1, 'arg2': 2, 'unrelated': 0}) == ([7, 8, 3], {})
+
+def test_var_parameters():
+    var_layout = SignatureLayout(inspect.signature(foo_var))
+    assert var_layout.bind((1, 2, 3), {'x': 4}) == ([1, 2, 3], {'x': 4})
+    assert var_layout.names == ('arg1',)
+    assert var_layout.var_positional == 'args' and var_layout.var_keyword == 'kwargs'
+
+def test_values_are_never_compared_by_equality():
+    class ArrayLike:
+        def __eq__(self, other):
+            raise ValueError('truth value is ambiguous')
+
+    value = ArrayLike()
+    new_args, _ = layout.bind((value, value), {})
+    assert new_args[0] is value and new_args[1] is value
+    new_args, _ = layout.bind((), {'arg2': value}, {'arg1': value})
+    assert new_args[0] is value and new_args[1] is value
+
+def test_arg_formatter_contract():
+    params = inspect.signature(foo).parameters
+    assert arg_formatter(params, (1, 2), {}) == ([1, 2, 3], {})
+    assert arg_formatter(params, (), {'arg2': 2}, preseded_args_dict={'arg1': 1}) == ([1, 2, 3], {})
+    assert arg_formatter(params, (), {}) == (None, 0)
@@ -0,0 +1,196 @@
+"""
+Per-call budgets for the decorator hot paths.
+
+These tests pin down performance properties (allocations, signature recomputation, dict copies,
+    logging) so regressions show up in the test suite instead of in profiles.
+"""
+import inspect
+import logging
+import sys
+import tracemalloc
+from collections import Counter
+
+import pytest
+from easytools.flexmethod import flexmethod
+from easytools.adaptive_method import untyped
+
+
+class CallCounter:
+    """
+    count the python functions and builtins called inside the block.
+
+        with CallCounter() as calls:
+            MyClass.foo(1, 2)
+        calls.count(inspect.signature), calls.count_builtin('dict.update')
+    """
+
+    def __enter__(self):
+        self.calls = Counter()
+        self.builtin_calls = Counter()
+        self.previous = sys.getprofile()
+        sys.setprofile(self.profile)
+        return self
+
+    def __exit__(self, *exc):
+        sys.setprofile(self.previous)
+        # leaving the block is not part of the measured code
+        self.calls.pop(CallCounter.__exit__.__code__, None)
+
+    def profile(self, frame, event, arg):
+        if event == 'call':
+            self.calls[frame.f_code] += 1
+        elif event == 'c_call':
+            self.builtin_calls[getattr(arg, '__qualname__', arg.__name__)] += 1
+
+    def count(self, func):
+        return self.calls[func.__code__]
+
+    def count_builtin(self, name):
+        return self.builtin_calls[name]
+
+
+def transient_bytes(call, repeat=3):
+    # peak memory allocated (and released) by one call, after warming up caches
+    for _ in range(repeat):
+        call()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        call()
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+
+def counted(call):
+    call()
+    with CallCounter() as calls:
+        call()
+    return calls
+
+
+class Namespace:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class Budget:
+    def __init__(self, arg1, arg2):
+        self.arg1 = arg1
+        self.arg2 = arg2
+
+    @flexmethod
+    def dummy(nself, arg3):
+        return nself.arg1 + nself.arg2 + arg3
+
+    @flexmethod.nsinsert
+    def nsinsert(nself, arg3):
+        return nself.arg1 + nself.arg2 + arg3
+
+    @flexmethod.nssync('arg1', 'arg2')
+    def nssync(nself, arg3):
+        return nself.arg1 + nself.arg2 + arg3
+
+    @flexmethod('arg1', 'arg2')
+    def inject(nself, arg3, arg4=0):
+        return nself.arg1 + nself.arg2 + arg3 + arg4
+
+    @flexmethod.staticsig('arg1', 'arg2', 'arg3')
+    def staticsig(nself, arg3):
+        return nself.arg1 + nself.arg2 + arg3
+
+    @flexmethod('arg1', 'arg3', arg2=2)
+    def full(nself, arg3):
+        return nself.arg1 + nself.arg2 + arg3
+
+    @flexmethod.overload
+    def overload(nself, arg3: int):
+        return arg3
+
+    @untyped({'a': 'arg1', 'b': 'arg2'})
+    def untyped_map(self, a, b, c=0):
+        return a + b + c
+
+    @untyped(['arg1', 'arg2'])
+    def untyped_list(self, arg1, arg2, c=0):
+        return arg1 + arg2 + c
+
+    @untyped()
+    def untyped_plain(self, arg1, arg2, c=0):
+        return arg1 + arg2 + c
+
+
+instance = Budget(1, 2)
+
+# name: (call, transient bytes, python function calls, dict copies/updates)
+# each call includes the attribute access that produces the endpoint
+static_budgets = {
+    'dummy': (lambda: Budget.dummy({'arg1': 1, 'arg2': 2}, 3), 1536, 25, 2),
+    'dummy_namespace': (lambda: Budget.dummy(Namespace(arg1=1, arg2=2), 3), 1536, 25, 3),
+    'nsinsert': (lambda: Budget.nsinsert({'arg1': 1, 'arg2': 2}, 3), 1536, 25, 2),
+    'nssync': (lambda: Budget.nssync(1, 2, 3), 1536, 25, 3),
+    'inject': (lambda: Budget.inject(1, 2, 3, arg4=4), 1792, 25, 3),
+    'inject_prefixed': (lambda: Budget.inject(1, nself_arg2=2, arg3=3), 1792, 25, 3),
+    'staticsig': (lambda: Budget.staticsig(1, 2, 3), 1536, 25, 2),
+    'full': (lambda: Budget.full(1, 3), 1536, 25, 2),
+    'overload': (lambda: Budget.overload(3), 1024, 20, 1),
+    'untyped_map': (lambda: Budget.untyped_map(1, 2), 768, 10, 1),
+    'untyped_list': (lambda: Budget.untyped_list(1, 2), 768, 10, 1),
+    'untyped_plain': (lambda: Budget.untyped_plain(1, 2), 768, 10, 1),
+}
+
+instance_budgets = {
+    'dummy': (lambda: instance.dummy(3), 1280, 20, 1),
+    'nsinsert': (lambda: instance.nsinsert(3), 1280, 20, 1),
+    'nssync': (lambda: instance.nssync(3), 1280, 20, 1),
+    'inject': (lambda: instance.inject(3, arg4=4), 1536, 20, 1),
+    'staticsig': (lambda: instance.staticsig(3), 1280, 20, 1),
+    'full': (lambda: instance.full(3), 1280, 20, 1),
+    'overload': (lambda: instance.overload(3), 1024, 20, 1),
+    'untyped_map': (lambda: instance.untyped_map(c=1), 1280, 15, 1),
+    'untyped_list': (lambda: instance.untyped_list(), 1280, 15, 1),
+    'untyped_plain': (lambda: instance.untyped_plain(), 1280, 15, 1),
+}
+
+budgets = [pytest.param(*budget, id=f'static-{name}') for name, budget in static_budgets.items()] + \
+    [pytest.param(*budget, id=f'instance-{name}') for name, budget in instance_budgets.items()]
+
+
+@pytest.mark.parametrize('call, max_bytes, max_calls, max_dict_copies', budgets)
+def test_allocation_budget(call, max_bytes, max_calls, max_dict_copies):
+    assert transient_bytes(call) <= max_bytes
+
+
+@pytest.mark.parametrize('call, max_bytes, max_calls, max_dict_copies', budgets)
+def test_call_budget(call, max_bytes, max_calls, max_dict_copies):
+    calls = counted(call)
+    assert sum(calls.calls.values()) <= max_calls
+    assert calls.count_builtin('dict.copy') + calls.count_builtin('dict.update') <= max_dict_copies
+
+
+@pytest.mark.parametrize('call, max_bytes, max_calls, max_dict_copies', budgets)
+def test_no_signature_recomputation_after_first_access(call, max_bytes, max_calls, max_dict_copies):
+    calls = counted(call)
+    assert calls.count(inspect.signature) == 0
+    assert calls.count(inspect.Signature.__init__) == 0
+
+
+@pytest.mark.parametrize('call, max_bytes, max_calls, max_dict_copies', budgets)
+def test_no_logging_on_call(call, max_bytes, max_calls, max_dict_copies):
+    calls = counted(call)
+    assert calls.count(logging.info) == 0
+    assert calls.count(logging.Logger.isEnabledFor) == 0
+
+
+def test_bound_static_call_budget():
+    bound = Budget.inject.bind(1, 2)
+    calls = counted(lambda: bound(3, arg4=4))
+    # the lambda and the function itself; no parsing in between
+    assert sum(calls.calls.values()) == 2
+    assert transient_bytes(lambda: bound(3, arg4=4)) <= 512
+
+
+@pytest.mark.parametrize('call', [instance_budgets[name][0] for name in ('untyped_map', 'untyped_list', 'untyped_plain')])
+def test_untyped_instance_call_does_not_list_attributes(call):
+    calls = counted(call)
+    assert calls.count_builtin('dir') == 0
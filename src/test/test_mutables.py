@@ -0,0 +1,160 @@
+import pytest
+import multiprocessing
+from easytools.mutables import MutableInteger, MutableIntegerArray, AtomicInteger, SharedMutableIntegerArray, \
+    ShardedCounter
+
+
+def test_mutable_integer_is_slotted():
+    m = MutableInteger(3)
+    assert not hasattr(m, '__dict__')
+    with pytest.raises(AttributeError):
+        m.other = 1
+
+def test_mutable_integer_arithmetic():
+    m = MutableInteger(7)
+    assert (m + 1, m - 1, m * 2, m / 2, m // 2, m % 4, m ** 2, pow(m, 2, 5)) == (8, 6, 14, 3.5, 3, 3, 49, 4)
+    assert (1 + m, 10 - m, 2 * m, 14 / m, 15 // m, 15 % m, 2 ** m) == (8, 3, 14, 2.0, 2, 1, 128)
+    assert (m << 1, m >> 1, m & 3, m ^ 1, m | 8, ~m) == (14, 3, 3, 6, 15, -8)
+    assert m == 7 and m != 8 and m < 8 and m <= 7 and m > 6 and m >= 7
+    m += 3
+    assert int(m) == 10
+
+def test_mutable_integers_combine():
+    # int(self).__add__(other) used to return NotImplemented here
+    a, b = MutableInteger(2), MutableInteger(5)
+    assert a + b == 7
+    assert a < b
+    assert [10, 20, 30][a] == 30
+
+def test_mutable_integer_repr():
+    assert repr(MutableInteger(4)) == "MutableInteger(4)"
+    assert str(MutableInteger(4)) == "4"
+
+def test_array_views_write_through():
+    counters = MutableIntegerArray(5)
+    hits = counters[2]
+    hits += 3
+    hits += 1
+    counters.add(4)
+    counters[-1].set(9)
+    assert counters.tolist() == [0, 0, 4, 0, 9]
+    assert hits == 4 and hits * 2 == 8
+    assert repr(counters) == "MutableIntegerArray([0, 0, 4, 0, 9])"
+    with pytest.raises(IndexError):
+        counters[5]
+
+def test_array_item_assignment():
+    counters = MutableIntegerArray(3)
+    counters[1] += 2
+    counters[-1] = MutableInteger(7)
+    counters[0] = counters[1]
+    assert counters.tolist() == [2, 2, 7]
+
+def test_array_bulk_operations():
+    counters = MutableIntegerArray([3, -1, 7])
+    assert (counters.sum(), counters.max(), counters.min()) == (9, 7, -1)
+    counters.reset()
+    assert counters.tolist() == [0, 0, 0]
+    counters.reset(2)
+    assert counters.sum() == 6
+    assert len(counters.data) * counters.data.itemsize == 24
+
+def test_array_numpy_backing():
+    pytest.importorskip('numpy')
+    counters = MutableIntegerArray(4, use_numpy=True)
+    view = counters[1]
+    view += 5
+    assert type(int(view)) is int and view == 5
+    assert (counters.sum(), counters.max(), counters.min()) == (5, 5, 0)
+    counters.reset(1)
+    assert counters.tolist() == [1, 1, 1, 1]
+
+def test_atomic_operations():
+    a = AtomicInteger(5)
+    assert a.fetch_add(2) == 5 and a == 7
+    assert a.get_and_set(1) == 7 and a == 1
+    assert not a.compare_and_set(2, 10) and a == 1
+    assert a.compare_and_set(1, 10) and a == 10
+    a -= 4
+    assert a + 1 == 7 and repr(a) == "AtomicInteger(6)"
+
+def test_atomic_no_lost_updates():
+    import sys
+    import threading
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible
+    try:
+        a = AtomicInteger()
+        def work():
+            counter = a
+            for _ in range(20000):
+                counter += 1
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(old_interval)
+    assert a == 80000
+
+def shared_work(counters, n):
+    for i in range(n):
+        counters[i % 3] += 1
+    counters.add(3, n)
+    counters.close()
+
+def test_shared_array_across_processes():
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        pytest.skip("needs fork")
+    context = multiprocessing.get_context('fork')
+    with SharedMutableIntegerArray(4, stripes=2, context=context) as counters:
+        workers = [context.Process(target=shared_work, args=(counters, 3000)) for _ in range(4)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        assert counters.tolist() == [4000, 4000, 4000, 12000]
+
+def test_shared_array_attach_by_name():
+    with SharedMutableIntegerArray([5, 6]) as counters:
+        other = SharedMutableIntegerArray.__new__(SharedMutableIntegerArray)
+        other.__setstate__(counters.__getstate__())
+        other[1] += 4
+        other.close()
+        assert counters.tolist() == [5, 10]
+        assert counters.sum() == 15 and counters.max() == 10
+
+def test_sharded_counter_threads():
+    import threading
+    counter = ShardedCounter(10)
+    def work():
+        c = counter
+        for _ in range(10000):
+            c += 1
+        c -= 100
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert counter == 10 + 8 * 9900
+    assert len(counter._stripes) == 9  # the creating thread and the workers
+
+def test_sharded_counter_protocol():
+    counter = ShardedCounter(4)
+    counter += 2
+    assert counter * 2 == 12 and counter > 5 and int(counter) == 6 and repr(counter) == "ShardedCounter(6)"
+    counter.set(1)
+    assert counter == 1
+    counter.value = 9
+    assert counter.value == 9
+
+def test_sharded_counter_cached_total():
+    import time
+    counter = ShardedCounter(cache_ttl=0.05)
+    assert counter == 0
+    counter += 5
+    assert counter == 0  # still the cached total
+    time.sleep(0.06)
+    assert counter == 5
@@ -0,0 +1,136 @@
+import pytest
+from array import array
+from easytools.flexmethod import flexmethod
+from easytools.decorator_bases import EasyDecorator
+from easytools.adaptive_method import untyped
+from easytools.record_table import RecordTable
+
+
+class Point:
+    scale = 1
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    @flexmethod
+    def total(nself, offset=0):
+        return (nself.x + nself.y) * nself.scale + offset
+
+    @flexmethod('x', 'y')
+    def shifted(nself, dx):
+        return nself.x + dx
+
+    def norm1(self):
+        return abs(self.x) + abs(self.y)
+
+
+def test_columns_are_packed_into_arrays():
+    table = RecordTable(Point, {'x': [1, 2, 3], 'y': [0.5, 1, 1.5], 'name': ['a', 'b', 'c']})
+    assert table.column('x').typecode == 'q'
+    assert table.column('y').typecode == 'd'
+    assert table.column('name') == ['a', 'b', 'c']
+    assert len(table) == 3
+
+def test_existing_arrays_are_not_copied():
+    xs = array('q', [1, 2, 3])
+    table = RecordTable(Point, {'x': xs, 'y': array('q', [4, 5, 6])})
+    table[1].x = 20
+    assert xs[1] == 20
+    assert table.column('x') is xs
+
+def test_rows_act_as_instances():
+    table = RecordTable(Point, {'x': [1, 2], 'y': [3, 4]})
+    row = table[-1]
+    assert isinstance(row, Point)
+    assert (row.x, row.y) == (2, 4)
+    assert row.norm1() == 6
+    assert row.total(1) == 7
+
+def test_rows_as_flexmethod_namespace():
+    table = RecordTable(Point, {'x': [1, 2], 'y': [3, 4]})
+    assert Point.total(table[0]) == 4
+    assert Point.total(table[1], offset=10) == 16
+
+def test_call_over_table():
+    table = RecordTable(Point, {'x': [1, 2, 3], 'y': [3, 4, 5]})
+    assert table.call('total') == [4, 6, 8]
+    assert table.call('total', 1) == [5, 7, 9]
+    assert table.call('shifted', 10) == [11, 12, 13]
+    assert table.call('norm1') == [4, 6, 8]
+
+def test_from_instances_and_append():
+    table = RecordTable.from_instances(Point, [Point(1, 2), Point(3, 4)])
+    table.append(x=5, y=6)
+    assert [row.x for row in table] == [1, 3, 5]
+    with pytest.raises(ValueError):
+        table.append(x=1)
+
+def test_failed_append_leaves_table_unchanged():
+    table = RecordTable(Point, {'x': [1, 3], 'y': [2, 4]})
+    with pytest.raises(TypeError):
+        table.append(x=5, y=2.5)
+    assert len(table) == 2
+    assert [len(column) for column in table.columns.values()] == [2, 2]
+    table.append(x=6, y=7)
+    assert (table[2].x, table[2].y) == (6, 7)
+
+def test_mismatched_column_lengths():
+    with pytest.raises(ValueError):
+        RecordTable(Point, {'x': [1, 2], 'y': [1]})
+    with pytest.raises(IndexError):
+        RecordTable(Point, {'x': [1], 'y': [1]})[1]
+
+def test_numpy_columns():
+    np = pytest.importorskip('numpy')
+    table = RecordTable(Point, {'x': np.arange(3), 'y': np.ones(3)})
+    assert table.call('total') == [1, 2, 3]
+    table.append(x=3, y=1)
+    assert len(table.column('x')) == 4
+
+
+class non_negative(EasyDecorator):
+    def wrapper(self, *args, **kwargs):
+        if any(a < 0 for a in args if isinstance(a, int)):
+            raise ValueError('negative argument')
+        return self.func(*args, **kwargs)
+
+
+class Cell:
+    def __init__(self, v):
+        self.v = v
+
+    @non_negative
+    @flexmethod
+    def f(nself, d):
+        return nself.v + d
+
+    @flexmethod.overload
+    def g(nself, x: int):
+        return ('int', x)
+
+    @g.register
+    def _(nself, x: str):
+        return ('str', x)
+
+    @untyped({'a': 'v'})
+    def h(self, a, b=1):
+        return a * b
+
+
+def test_call_matches_rows_for_stacked_layers():
+    table = RecordTable(Cell, {'v': [1, 2]})
+    with pytest.raises(ValueError):
+        table[0].f(-1)
+    with pytest.raises(ValueError):
+        table.call('f', -1)
+    assert table.call('f', 1) == [row.f(1) for row in table] == [2, 3]
+
+def test_call_matches_rows_for_overloads():
+    table = RecordTable(Cell, {'v': [1, 2]})
+    assert table.call('g', 'a') == [row.g('a') for row in table] == [('str', 'a'), ('str', 'a')]
+    assert table.call('g', 3) == [('int', 3), ('int', 3)]
+
+def test_call_matches_rows_for_untyped():
+    table = RecordTable(Cell, {'v': [1, 2]})
+    assert table.call('h', b=3) == [row.h(b=3) for row in table] == [3, 6]
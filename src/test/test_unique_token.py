@@ -0,0 +1,52 @@
+import pytest
+from easytools.unique_token import UniqueTokenHandler
+
+
+def test_lookup_both_ways():
+    u = UniqueTokenHandler()
+    tokens = [u.generate() for _ in range(3)]
+    assert [u.get(t) for t in tokens] == [0, 1, 2]
+    assert [u.get(i) for i in range(3)] == tokens
+    assert tokens[0].startswith("$") and len(tokens[0]) == 6
+
+def test_ids_not_reused_after_delete():
+    u = UniqueTokenHandler()
+    a, b, c = u.generate(), u.generate(), u.generate()
+    u.delete(a)
+    u.delete(1)
+    d = u.generate()
+    assert u.get(d) == 3
+    assert u.get(c) == 2
+    assert u.generated == {c: 2, d: 3}
+    assert u.tokens == {2: c, 3: d}
+    with pytest.raises(KeyError):
+        u.get(1)
+    with pytest.raises(KeyError):
+        u.get(b)
+
+def test_seeded_generation_is_reproducible():
+    a, b = UniqueTokenHandler(seed=3), UniqueTokenHandler(seed=3)
+    assert [a.generate() for _ in range(5)] == [b.generate() for _ in range(5)]
+    assert a.generate_many(10) == b.generate_many(10)
+
+def test_collisions_are_redrawn():
+    # 60 draws out of 118 one-character tokens are all but certain to collide
+    u = UniqueTokenHandler(complexity=1, seed=0)
+    tokens = u.generate_many(60)
+    assert len(set(tokens)) == len(tokens) == len(u.generated)
+    assert sorted(u.generated.values()) == list(range(len(tokens)))
+
+def test_running_out_of_tokens():
+    u = UniqueTokenHandler(complexity=1, seed=0)
+    u.combining_chars = ['a', 'b']
+    assert sorted(u.generate_many(2)) == ['$a', '$b']
+    with pytest.raises(ValueError):
+        u.generate()
+
+def test_generate_many():
+    u = UniqueTokenHandler(seed=1)
+    first = u.generate()
+    tokens = u.generate_many(1000, complexity=3)
+    assert len(set(tokens)) == 1000 and first not in tokens
+    assert all(len(t) == 4 for t in tokens)
+    assert [u.get(t) for t in tokens[:3]] == [1, 2, 3]
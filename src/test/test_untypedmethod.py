@@ -478,6 +478,311 @@ def testT62_test_namespace_injection_mode_signature():
 
 
 
+# ===== Namespace Pre-binding Tests =====
+
+def testT67_test_bind__signature_inject():
+    bound = MyClass.foo.bind(nself_arg1=1, nself_arg2=2)
+    assert bound(3, 4) == 10
+    assert bound(arg1=3, arg2=5) == 11
+
+def testT68_test_bind__signature_inject_positional_and_default():
+    bound = MyClass.foo.bind(1)
+    assert bound(3, 4) == 8
+
+def testT69_test_bind__signature_inject_missing_namespace_arg():
+    with pytest.raises(TypeError):
+        MyClass.foo.bind(nself_arg2=2)
+
+def testT70_test_bind__signature_inject_unexpected_namespace_arg():
+    with pytest.raises(TypeError):
+        MyClass.foo.bind(nself_arg1=1, extra=5)
+
+def testT71_test_bind__dummy_namespace():
+    bound = MyClass4.foo_with_defaults.bind({'arg1':1, 'arg2':3})
+    assert bound() == 9
+    assert bound(arg3=6) == 10
+
+def testT72_test_bind__full_signature_fixed_defaults():
+    bound = MyClass2.foo3.bind()
+    assert bound(1, 2) == 9
+    assert bound(1, 2, 3) == 6
+    assert bound(1, 2, arg3=4) == 7
+
+def testT73_test_bind__full_signature_namespace():
+    bound = MyClass2.foo2.bind(arg2=3)
+    assert bound(1) == 4
+
+def testT74_test_bind__static_only():
+    # an instance already is its namespace
+    assert not hasattr(MyClass3(1, 2).foo_with_args, 'bind')
+
+def testT74_2_test_bind__set_once_per_endpoint():
+    assert MyClass.foo.bind is MyClass.foo.bind
+
+
+# ===== Stacked Decorator Tests =====
+
+from easytools.decorator_bases import EasyDecorator
+
+class non_negative(EasyDecorator):
+    def wrapper(self, *args, **kwargs):
+        if any(a < 0 for a in args if isinstance(a, int)):
+            raise ValueError('negative argument')
+        return self.func(*args, **kwargs)
+
+class passthrough(EasyDecorator):
+    def wrapper(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+call_depths = {}
+
+class MyClass8:
+    def __init__(nself, arg1):
+        nself.arg1 = arg1
+
+    @flexmethod('arg1')
+    def depth0(nself, arg2):
+        call_depths[0] = len(inspect.stack(0))
+        return nself.arg1 + arg2
+
+    @non_negative
+    @flexmethod('arg1')
+    def depth1(nself, arg2):
+        call_depths[1] = len(inspect.stack(0))
+        return nself.arg1 + arg2
+
+    @passthrough
+    @non_negative
+    @flexmethod('arg1')
+    def depth2(nself, arg2):
+        call_depths[2] = len(inspect.stack(0))
+        return nself.arg1 + arg2
+
+    @non_negative
+    @flexmethod
+    def dummy(nself, arg2):
+        return nself.arg1 + arg2
+
+def testT75_test_stacked__static_and_instance_calls():
+    assert MyClass8.depth2(1, 2) == 3
+    assert MyClass8(5).depth2(2) == 7
+    assert MyClass8.dummy({'arg1': 1}, 2) == 3
+    assert MyClass8(5).dummy(2) == 7
+
+def testT76_test_stacked__outer_layer_runs():
+    with pytest.raises(ValueError):
+        MyClass8.depth1(-1, 2)
+
+def testT77_test_stacked__shared_signature():
+    assert str(inspect.signature(MyClass8.depth2)) == "(nself_arg1, arg2)"
+    assert MyClass8.depth2.__name__ == 'depth2'
+
+def framework_calls(call):
+    # python calls made by easytools itself (not by the decorated function or the user's layers) for one call
+    import os, sys, easytools
+    root = os.path.dirname(easytools.__file__)
+    calls = []
+    call()
+    sys.setprofile(lambda frame, event, arg: event == 'call' and calls.append(frame.f_code.co_filename))
+    try:
+        call()
+    finally:
+        sys.setprofile(None)
+    return sum(1 for filename in calls if filename.startswith(root))
+
+def testT78_test_stacked__constant_overhead():
+    MyClass8.depth0(1, 2)
+    MyClass8.depth1(1, 2)
+    MyClass8.depth2(1, 2)
+    assert call_depths[1] - call_depths[0] == 1
+    assert call_depths[2] - call_depths[1] == 1
+    # the stack is prepared once per context and class; adding layers adds only the layers' own wrappers
+    static = [framework_calls(lambda: getattr(MyClass8, f'depth{n}')(1, 2)) for n in range(3)]
+    assert static[2] == static[1] == static[0]
+    instance = MyClass8(1)
+    bound = [framework_calls(lambda: getattr(instance, f'depth{n}')(2)) for n in range(3)]
+    assert bound[2] == bound[1] == bound[0]
+
+# ===== Overload Tests =====
+
+class MyClass9:
+    def __init__(nself, width, height):
+        nself.width = width
+        nself.height = height
+
+    @flexmethod.overload
+    def area(nself, width: int, height: int):
+        return 'int', width * height
+
+    @area.register
+    def area(nself, width: float, height: float = 2.0):
+        return 'float', width * height
+
+    @area.register('instance')
+    def area(nself):
+        return 'instance', nself.width * nself.height
+
+    @area.register('static')
+    def area(nself, name: str):
+        return 'static', name
+
+def testT79_test_overload__dispatch_by_type():
+    assert MyClass9.area(2, 3) == ('int', 6)
+    assert MyClass9.area(2.0) == ('float', 4.0)
+    assert MyClass9.area(True, 3) == ('int', 3)
+
+def testT80_test_overload__dispatch_by_context():
+    instance = MyClass9(2, 5)
+    assert instance.area() == ('instance', 10)
+    assert instance.area(1, 1) == ('int', 1)
+    assert MyClass9.area('square') == ('static', 'square')
+    with pytest.raises(TypeError):
+        instance.area('square')
+    with pytest.raises(TypeError):
+        MyClass9.area()
+
+def testT81_test_overload__cached_per_type_tuple():
+    overload = MyClass9.__dict__['area']
+    MyClass9.area(4, 5)
+    assert overload.dispatch_cache[(False, int, int)](None, 4, 5) == ('int', 20)
+
+def testT87_test_overload__keyword_arguments():
+    assert MyClass9.area(width=2, height=3) == ('int', 6)
+    assert MyClass9.area(2, height=3) == ('int', 6)
+    assert MyClass9.area(width=2.0) == ('float', 4.0)
+    assert MyClass9.area(name='square') == ('static', 'square')
+    assert MyClass9(2, 5).area(height=1, width=1) == ('int', 1)
+    with pytest.raises(TypeError):
+        MyClass9.area(2, width=3)
+    with pytest.raises(TypeError):
+        MyClass9.area(depth=3)
+
+def testT88_test_overload__keyword_only_parameters():
+    class MyClass12:
+        @flexmethod.overload
+        def scale(nself, x: int, *, by: int):
+            return 'int', x * by
+
+        @scale.register
+        def scale(nself, x: int, *, by: float = 0.5):
+            return 'float', x * by
+
+    assert MyClass12.scale(2, by=3) == ('int', 6)
+    assert MyClass12.scale(2, by=1.5) == ('float', 3.0)
+    assert MyClass12.scale(2) == ('float', 1.0)
+
+def testT89_test_overload__generic_and_union_hints():
+    from typing import List, Optional
+
+    class MyClass13:
+        @flexmethod.overload
+        def f(nself, x: int):
+            return 'int'
+
+        @f.register
+        def f(nself, x: List[int]):
+            return 'list'
+
+        @f.register
+        def f(nself, x: Optional[str]):
+            return 'str or None'
+
+    assert MyClass13.f(1) == 'int'
+    assert MyClass13.f([1]) == 'list'
+    assert MyClass13.f('a') == 'str or None'
+    assert MyClass13.f(None) == 'str or None'
+    with pytest.raises(TypeError):
+        MyClass13.f(1.5)
+
+def testT90_test_overload__self_referencing_hint():
+    class Vec:
+        def __init__(nself, x):
+            nself.x = x
+
+        @flexmethod.overload
+        def combine(nself, other: 'Vec'):
+            return 'vec', nself.x + other.x
+
+        @combine.register
+        def combine(nself, other: int):
+            return 'int', nself.x + other
+
+    assert Vec(1).combine(Vec(2)) == ('vec', 3)
+    assert Vec(1).combine(2) == ('int', 3)
+    with pytest.raises(TypeError):
+        Vec(1).combine('oops')
+
+def testT91_test_overload__unusable_hints():
+    from typing import Literal
+
+    with pytest.raises(TypeError):
+        class MyClass14:
+            @flexmethod.overload
+            def f(nself, x: Literal[1]):
+                pass
+
+    class MyClass15:
+        @flexmethod.overload
+        def f(nself, x: 'Missing'):
+            pass
+
+    with pytest.raises(TypeError):
+        MyClass15.f(1)
+
+def testT82_test_overload__no_arguments():
+    with pytest.raises(SyntaxError):
+        class MyClass10:
+            @flexmethod.overload()
+            def area(nself):
+                pass
+
+# ===== Call Shape Cache Tests =====
+
+class MyClass11:
+    @flexmethod('arg1', 'arg2')
+    def inject(nself, arg3, arg4=0):
+        return nself.arg1 + nself.arg2 + arg3 + arg4
+
+    @flexmethod('arg1', 'arg2', arg3=6)
+    def full(nself, arg2):
+        return nself.arg1 + arg2 + nself.arg3
+
+def testT83_test_shape_cache__hits_for_repeated_shape():
+    MyClass11.inject.cache_clear()
+    for i in range(5):
+        assert MyClass11.inject(1, 2, i, arg4=1) == 4 + i
+    info = MyClass11.inject.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (4, 1, 1)
+
+    assert MyClass11.inject(1, 2, arg3=3, nself_arg2=5) == 9
+    assert MyClass11.inject.cache_info().misses == 2
+    # exposed once per endpoint, not re-attached on every access
+    assert MyClass11.inject.cache_info is MyClass11.inject.cache_info
+
+def testT84_test_shape_cache__full_signature():
+    MyClass11.full.cache_clear()
+    assert MyClass11.full(1, 2) == 9
+    assert MyClass11.full(1, 2, arg3=3) == 6
+    assert MyClass11.full(4, 5) == 15
+    info = MyClass11.full.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+def testT85_test_shape_cache__errors_not_cached():
+    MyClass11.inject.cache_clear()
+    for i in range(2):
+        with pytest.raises(TypeError):
+            MyClass11.inject(1, 2, 3, extra=1)
+    assert MyClass11.inject.cache_info().currsize == 0
+
+def testT86_test_shape_cache__bounded():
+    from easytools.flexmethod import CallShapeCache
+    cache = CallShapeCache(maxsize=2)
+    for n in range(3):
+        cache.put((n, ()), n)
+    assert cache.get((0, ())) is None
+    assert cache.get((2, ())) == 2
+    assert cache.info() == (1, 1, 2, 2)
+
 
 if __name__ == "__main__":
     pytest.main()